@@ -1,9 +1,12 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Pattern, Union
 
-import pdfplumber
+import pypdfium2 as pdfium
 
 
 @dataclass
@@ -22,13 +25,28 @@ class OrderInfo:
     total: Optional[float] = None
 
 
-_MONEY = re.compile(r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)")
+# The amount always starts at the first digit (any "$"/space before it is optional), so the
+# pattern leads with the digit class and lets the regex engine skip straight to it.
+_MONEY = re.compile(r"[0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?")
+
+# Field patterns (compiled once; these run for every page of every receipt)
+_PAT_PO = re.compile(r"\bPurchase\s+Order\b\s*([A-Z0-9\-]+)\b", re.I)
+_PAT_INVOICE = re.compile(r"\bInvoice\b\s*([A-Z0-9\-]+)\b", re.I)
+_PAT_INV_DATE = re.compile(r"\bInvoice\s+Date\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", re.I)
+_PAT_ACCT = re.compile(r"\bYour\s+Account\b\s*([A-Z0-9\-]+)\b", re.I)
+_PAT_CC = re.compile(r"\bCredit\s+Card\s+([A-Za-z]+)\s+Ending-\s*([0-9]{4})\b", re.I)
+_PAT_PAY_RECV = re.compile(r"\bPayment\s+Received\b\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", re.I)
+_PAT_PAY_DATE_BLOCK = re.compile(r"\bDate\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", re.I)
+
+_PAT_BLANKS = re.compile(r"[ \t]+")
+_PAT_BREAKS = re.compile(r"\n{3,}")
 
 
 def normalize_text(txt: str) -> str:
+    # "\r" -> "\n" first, so a CRLF counts as two line breaks (a blank line)
     txt = (txt or "").replace("\r", "\n")
-    txt = re.sub(r"[ \t]+", " ", txt)
-    txt = re.sub(r"\n{3,}", "\n\n", txt)
+    txt = _PAT_BLANKS.sub(" ", txt)
+    txt = _PAT_BREAKS.sub("\n\n", txt)
     return txt.strip()
 
 
@@ -38,49 +56,71 @@ def money_to_float(s: str) -> Optional[float]:
     m = _MONEY.search(s)
     if not m:
         return None
-    return float(m.group(1).replace(",", ""))
+    return float(m.group().replace(",", ""))
 
 
 def parse_mmddyy(s: str) -> Optional[datetime]:
     if not s:
         return None
-    s = s.strip()
-    for fmt in ("%m/%d/%y", "%m/%d/%Y"):
-        try:
-            return datetime.strptime(s, fmt)
-        except ValueError:
-            pass
-    return None
+    # Hand-rolled M/D/YY[YY] parse; same results as strptime("%m/%d/%y") then "%m/%d/%Y",
+    # without re-parsing a format string on every call.
+    parts = s.strip().split("/")
+    if len(parts) != 3:
+        return None
+    mo, da, yr = parts
+    if len(da) == 2 and da[0] == " ":
+        da = da[1:]  # %d also accepts a space-padded day
+    if not (len(mo) in (1, 2) and len(da) in (1, 2) and len(yr) in (2, 4)):
+        return None
+    if not (mo + da + yr).isascii() or not (mo + da + yr).isdigit():
+        return None
+    year = int(yr)
+    if len(yr) == 2:
+        year += 2000 if year < 69 else 1900  # strptime's %y pivot
+    try:
+        return datetime(year, int(mo), int(da))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern: str, flags: int) -> Pattern[str]:
+    return re.compile(pattern, flags)
 
 
-def extract_first(pattern: str, text: str, flags=re.I) -> Optional[str]:
-    m = re.search(pattern, text, flags)
+def extract_first(pattern: Union[str, Pattern[str]], text: str, flags=re.I) -> Optional[str]:
+    """
+    Return group(1) of the first match, stripped.
+    Accepts a precompiled pattern (preferred) or a str pattern, which is compiled once and cached.
+    """
+    pat = pattern if isinstance(pattern, re.Pattern) else _compile(pattern, flags)
+    m = pat.search(text)
     return m.group(1).strip() if m else None
 
 
 def extract_invoice(text: str) -> Optional[Union[int, str]]:
-    raw = extract_first(r"\bInvoice\b\s*([A-Z0-9\-]+)\b", text)
+    raw = extract_first(_PAT_INVOICE, text)
     if raw is None:
         return None
     return int(raw) if raw.isdigit() else raw
 
 
 def extract_purchase_order(text: str) -> Optional[str]:
-    return extract_first(r"\bPurchase\s+Order\b\s*([A-Z0-9\-]+)\b", text)
+    return extract_first(_PAT_PO, text)
 
 
 def extract_invoice_date(text: str) -> Optional[datetime]:
-    raw = extract_first(r"\bInvoice\s+Date\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", text)
+    raw = extract_first(_PAT_INV_DATE, text)
     return parse_mmddyy(raw) if raw else None
 
 
 def extract_account_number(text: str) -> Optional[str]:
-    return extract_first(r"\bYour\s+Account\b\s*([A-Z0-9\-]+)\b", text)
+    return extract_first(_PAT_ACCT, text)
 
 
 def extract_credit_card(text: str) -> Optional[str]:
     # Matches: "Credit Card Amex Ending- 2008"
-    m = re.search(r"\bCredit\s+Card\s+([A-Za-z]+)\s+Ending-\s*([0-9]{4})\b", text, re.I)
+    m = _PAT_CC.search(text)
     if m:
         brand = m.group(1).strip().title()
         last4 = m.group(2)
@@ -90,15 +130,19 @@ def extract_credit_card(text: str) -> Optional[str]:
 
 def extract_payment_date(text: str) -> Optional[datetime]:
     # Prefer: "Payment Received 11/11/25 (146.41)"
-    m = re.search(r"\bPayment\s+Received\b\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", text, re.I)
+    m = _PAT_PAY_RECV.search(text)
     if m:
         return parse_mmddyy(m.group(1))
 
     # Fallback: within payment-info block
+    return _payment_date_from_block(text)
+
+
+def _payment_date_from_block(text: str) -> Optional[datetime]:
     block_idx = text.lower().find("information about your payment")
     if block_idx != -1:
         window = text[block_idx:block_idx + 500]
-        m2 = re.search(r"\bDate\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", window, re.I)
+        m2 = _PAT_PAY_DATE_BLOCK.search(window)
         if m2:
             return parse_mmddyy(m2.group(1))
 
@@ -127,6 +171,28 @@ def extract_totals(text: str):
     return merch, ship, tax, total
 
 
+def extract_fields(text: str) -> dict:
+    """
+    Pull every OrderInfo field candidate from one page of text.
+    Returns a dict keyed by OrderInfo field name (None where not found).
+    """
+    # One search per field: each precompiled pattern scans the page in C and stops at its
+    # first hit, which measured faster than a single alternation over all of them
+    merch, ship, tax, total = extract_totals(text)
+    return {
+        "purchase_order": extract_purchase_order(text),
+        "invoice": extract_invoice(text),
+        "invoice_date": extract_invoice_date(text),
+        "account_number": extract_account_number(text),
+        "credit_card": extract_credit_card(text),
+        "payment_date": extract_payment_date(text),
+        "merchandise": merch,
+        "shipping": ship,
+        "sales_tax": tax,
+        "total": total,
+    }
+
+
 def is_complete(info: OrderInfo) -> bool:
     # your required set (sales_tax might legitimately be None)
     return all([
@@ -142,66 +208,144 @@ def is_complete(info: OrderInfo) -> bool:
     ])
 
 
-def merge_if_missing(info: OrderInfo, **kwargs):
+# One bit per required field (same set as is_complete; sales_tax has no bit)
+BIT_PO = 1 << 0
+BIT_INVOICE = 1 << 1
+BIT_INVOICE_DATE = 1 << 2
+BIT_ACCOUNT = 1 << 3
+BIT_PAYMENT_DATE = 1 << 4
+BIT_CREDIT_CARD = 1 << 5
+BIT_SHIPPING = 1 << 6
+BIT_MERCHANDISE = 1 << 7
+BIT_TOTAL = 1 << 8
+ALL_BITS = (1 << 9) - 1
+
+_REQUIRED_BITS = {
+    "purchase_order": BIT_PO,
+    "invoice": BIT_INVOICE,
+    "invoice_date": BIT_INVOICE_DATE,
+    "account_number": BIT_ACCOUNT,
+    "payment_date": BIT_PAYMENT_DATE,
+    "credit_card": BIT_CREDIT_CARD,
+    "shipping": BIT_SHIPPING,
+    "merchandise": BIT_MERCHANDISE,
+    "total": BIT_TOTAL,
+}
+
+
+def merge_if_missing(info: OrderInfo, **kwargs) -> int:
     """
     Fill fields only if they are currently None.
+    Returns the bitmask of required fields filled by this call (OR it into a running mask).
     """
+    filled = 0
     for k, v in kwargs.items():
         if getattr(info, k) is None and v is not None:
             setattr(info, k, v)
+            filled |= _REQUIRED_BITS.get(k, 0)
+    return filled
+
+
+def _page_text(pdf: "pdfium.PdfDocument", index: int) -> str:
+    page = pdf[index]  # pages load lazily; nothing past the last needed page is parsed
+    textpage = page.get_textpage()
+    try:
+        # Cheap probe: image-only pages (e.g. a scanned packing slip) have no text chars
+        if textpage.count_chars() <= 0:
+            return ""
+        return textpage.get_text_range() or ""
+    finally:
+        textpage.close()
+        page.close()
+
+
+# Documents at least this long fan pages 2..N out to worker processes.
+# Shorter receipts (the common case) finish on page 1 and never pay pool start-up.
+PARALLEL_MIN_PAGES = 4
+
+_worker_pdf: Optional["pdfium.PdfDocument"] = None
+
+
+def _init_page_worker(pdf_bytes: bytes) -> None:
+    # Runs once per worker process: load the document from bytes instead of re-opening the file per page
+    global _worker_pdf
+    _worker_pdf = pdfium.PdfDocument(pdf_bytes)
+
+
+def extract_page_fields(page_idx: int) -> Optional[dict]:
+    """
+    Worker entry point: field candidates for one page of the document loaded by
+    _init_page_worker, or None for a page without text.
+    """
+    text = normalize_text(_page_text(_worker_pdf, page_idx))
+    return extract_fields(text) if text else None
+
+
+def _merge_page(info: OrderInfo, found: dict, i: int, debug: bool) -> int:
+    # Merge into the global info (only fill missing fields; sales_tax stays None if not present)
+    filled = merge_if_missing(info, **found)
+
+    if debug:
+        print(f"page {i}: filled -> " + ", ".join(f"{k}={v is not None}" for k, v in found.items()))
+    return filled
+
+
+def _extract_pages_parallel(pdf_path: str, pages: range, info: OrderInfo, filled: int, debug: bool) -> int:
+    with open(pdf_path, "rb") as f:
+        pdf_bytes = f.read()
+
+    workers = min(len(pages), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_page_worker, initargs=(pdf_bytes,)) as pool:
+        futures = [pool.submit(extract_page_fields, i) for i in pages]
+
+        # Merge in page order so earlier pages still win, exactly like the serial scan
+        for i, fut in zip(pages, futures):
+            found = fut.result()
+            if found is not None:
+                filled |= _merge_page(info, found, i, debug)
+            if filled == ALL_BITS:
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+
+    return filled
 
 
 def extract_order_info_by_page(pdf_path: str, debug: bool = False) -> OrderInfo:
     """
     Scan each page independently and fill fields as they are found.
-    Stops early when all "required" fields are present.
+    Stops before extracting the next page once all "required" fields are present.
+    Long documents scan the pages after the first in parallel (see PARALLEL_MIN_PAGES).
     """
     info = OrderInfo()
+    filled = 0  # running bitmask of required fields (see merge_if_missing)
+
+    # Only plain text is needed here (no word boxes), so use pdfium's text layer
+    # rather than pdfplumber's layout analysis.
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        n_pages = len(pdf)
+        for i in range(n_pages):
+            # Check before extracting: page text extraction is the expensive part
+            if filled == ALL_BITS:
+                break
 
-    with pdfplumber.open(pdf_path) as p:
-        for i, page in enumerate(p.pages):
-            text = normalize_text(page.extract_text() or "")
+            if i > 0 and n_pages >= PARALLEL_MIN_PAGES:
+                filled = _extract_pages_parallel(pdf_path, range(i, n_pages), info, filled, debug)
+                break
+
+            text = normalize_text(_page_text(pdf, i))
             if not text:
                 continue
 
-            # Pull candidates from THIS page
-            po = extract_purchase_order(text)
-            inv = extract_invoice(text)
-            inv_date = extract_invoice_date(text)
-            acct = extract_account_number(text)
-            cc = extract_credit_card(text)
-            pay_date = extract_payment_date(text)
-            merch, ship, tax, total = extract_totals(text)
-
-            # Merge into the global info (only fill missing fields)
-            merge_if_missing(
-                info,
-                purchase_order=po,
-                invoice=inv,
-                invoice_date=inv_date,
-                account_number=acct,
-                credit_card=cc,
-                payment_date=pay_date,
-                merchandise=merch,
-                shipping=ship,
-                sales_tax=tax,   # keep None if not present
-                total=total,
-            )
-
-            if debug:
-                print(f"page {i}: filled -> "
-                      f"po={po is not None}, inv={inv is not None}, inv_date={inv_date is not None}, "
-                      f"acct={acct is not None}, cc={cc is not None}, pay_date={pay_date is not None}, "
-                      f"merch={merch is not None}, ship={ship is not None}, tax={tax is not None}, total={total is not None}")
-
-            if is_complete(info):
-                break
+            # Pull candidates from THIS page (one regex pass)
+            filled |= _merge_page(info, extract_fields(text), i, debug)
+    finally:
+        pdf.close()
 
     return info
 
 
 if __name__ == "__main__":
-    import os
     pdf_path = os.path.expanduser(
         "/not_in_use/McMaster_Items/receipts/Receipt 55152414.PDF"
     )
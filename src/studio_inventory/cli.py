@@ -4,11 +4,16 @@ from pathlib import Path
 from typing import Optional, Any
 from uuid import uuid4
 
+import atexit
 import csv
+import importlib
+import json
 import os
+import sqlite3
 import subprocess
 import sys
 
+from functools import lru_cache
 from importlib import resources
 import shutil
 
@@ -23,19 +28,27 @@ from studio_inventory.paths import (
     log_dir,
     label_presets_dir,
     label_templates_dir,
+    label_cache_dir,
     secrets_dir,
     project_root,
 )
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, FloatPrompt, Confirm
 from rich.table import Table
+from rich.segment import Segments
+
+from studio_inventory.db import (
+    DB,
+    INVENTORY_EVENTS_INDEX_SQL,
+    INVENTORY_VIEW_SQL,
+    PARTS_RECEIVED_INDEXES_SQL,
+    default_db_path,
+    utc_now_iso,
+)
 
-from studio_inventory.db import DB, default_db_path
-
-from studio_inventory.labels.make_pdf import make_labels_pdf, LabelTemplate
 from studio_inventory.labels.presets import list_label_presets, load_label_preset, save_label_preset
 
 app = typer.Typer(add_completion=False, no_args_is_help=False)
@@ -45,9 +58,6 @@ console = Console()
 # ----------------------------
 # Helpers
 # ----------------------------
-def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
-
 def ensure_inventory_events_table(db: DB) -> None:
     # Unified audit log for manual receive/remove actions
     db.execute(
@@ -65,16 +75,55 @@ def ensure_inventory_events_table(db: DB) -> None:
         )
         """
     )
+    db.execute(INVENTORY_EVENTS_INDEX_SQL)
 
 def header():
     console.print(Panel.fit("[bold]Studio Inventory[/bold]\nMenu-first CLI", border_style="cyan"))
 
+@lru_cache(maxsize=32)
+def _menu_frame(rows: tuple[tuple[str, str], ...], width: int) -> Segments:
+    menu = Table(show_header=False, box=None)
+    for key, label in rows:
+        menu.add_row(key, label)
+    return Segments(list(console.render(menu)))
+
+def menu_table(*rows: tuple[str, str]) -> Segments:
+    """Numbered menu, rendered once per terminal width and replayed on every redraw."""
+    return _menu_frame(rows, console.width)
+
 def pause():
     console.print()
     input("Press Enter to continue...")
 
+# One DB (and so one open connection) per database file for the whole session
+_DB_CACHE: dict[Path, DB] = {}
+
+@lru_cache(maxsize=None)
+def _resolved_db_path(path: Path) -> Path:
+    # Only for absolute paths (the default DB): a relative --db path depends on the cwd
+    return path.resolve()
+
 def get_db(db_path: Optional[Path] = None) -> DB:
-    return DB(path=db_path or default_db_path())
+    # Every menu calls this; the default path (memoized per workspace) resolves once, not per call
+    path = _resolved_db_path(default_db_path()) if not db_path else Path(db_path).resolve()
+    db = _DB_CACHE.get(path)
+    if db is None:
+        db = _DB_CACHE[path] = DB(path=path)
+    return db
+
+def close_dbs() -> None:
+    """Close every cached connection (on quit, and before the DB file is deleted)."""
+    while _DB_CACHE:
+        _, db = _DB_CACHE.popitem()
+        try:
+            db.close()
+        except Exception:
+            pass
+    # A closed DB may be deleted/recreated (hard reset): re-check its FTS index and indexes on next use
+    _fts_ready.clear()
+    _INDEXES_ENSURED.clear()
+
+atexit.register(close_dbs)
 
 def safe_str(v) -> str:
     return "" if v is None else str(v)
@@ -99,26 +148,25 @@ def _table_exists(db: DB, table: str) -> bool:
 
 
 def _table_columns(db: DB, table: str) -> set[str]:
-    if not _table_exists(db, table):
-        return set()
-    with db.connect() as con:
-        rows = con.execute(f'PRAGMA table_info("{table}");').fetchall()
-    return {r[1] for r in rows}  # (cid, name, type, notnull, dflt_value, pk)
+    # Served from the schema cache (see object_columns); empty when the table doesn't exist yet
+    return set(object_columns(db, f'"{table}"'))
 
 
 def _ensure_columns(db: DB, table: str, cols: dict[str, str]) -> None:
     existing = _table_columns(db, table)
     if not existing:
         return
-    with db.connect() as con:
-        for col, coltype in cols.items():
-            if col in existing:
-                continue
+    missing = [c for c in cols if c not in existing]
+    if not missing:
+        return
+    with db.conn as con:
+        for col in missing:
             try:
-                con.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}" {coltype};')
+                con.execute(f'ALTER TABLE "{table}" ADD COLUMN "{col}" {cols[col]};')
             except Exception:
                 # Ignore if already exists/locked; caller queries should be defensive.
                 pass
+    clear_schema_cache()
 
 
 def ensure_orders_ingest_schema(db: DB) -> None:
@@ -150,14 +198,149 @@ def ensure_orders_ingest_schema(db: DB) -> None:
 
 
 
+# DB paths whose indexes ensure_inventory_indexes has already created (once per path per
+# session, like _SCHEMA_CACHE; close_dbs forgets them)
+_INDEXES_ENSURED: set[Path] = set()
+
+def ensure_inventory_indexes(db: DB) -> None:
+    """Indexes behind the inventory browser's sort keys and item view (older DBs predate them)."""
+    if db.path in _INDEXES_ENSURED or not _table_exists(db, "parts_received"):
+        return
+    try:
+        with db.conn as con:
+            for stmt in PARTS_RECEIVED_INDEXES_SQL:
+                con.execute(stmt)
+            if _table_exists(db, "inventory_events"):
+                con.execute(INVENTORY_EVENTS_INDEX_SQL)
+    except sqlite3.Error:
+        return  # e.g. an ingest holds the write lock: browse unindexed for now, retry on the next visit
+    _INDEXES_ENSURED.add(db.path)
+
+def ensure_inventory_view(db: DB) -> None:
+    """Bring an older inventory_view up to INVENTORY_VIEW_SQL (ingest recreates it as well)."""
+    if not _table_exists(db, "parts_removed"):
+        return
+    current = db.scalar("SELECT sql FROM sqlite_master WHERE type = 'view' AND name = 'inventory_view'")
+    if not current or " ".join(current.split()) == " ".join(INVENTORY_VIEW_SQL.split()):
+        return
+    con = db.connect()
+    try:
+        # One transaction: readers never see the view missing
+        con.execute("BEGIN IMMEDIATE")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_parts_removed_part_key ON parts_removed(part_key);")
+        con.execute("DROP VIEW IF EXISTS inventory_view;")
+        con.execute(INVENTORY_VIEW_SQL)
+        con.commit()
+    except sqlite3.Error:
+        con.rollback()  # e.g. locked by an ingest; the old view still works
+    finally:
+        con.close()
+
+
+# ----------------------------
+# Inventory full-text search (FTS5)
+# ----------------------------
+# External-content index over parts_received, kept in sync by triggers. The trigram
+# tokenizer matches substrings (like LIKE '%term%') but needs terms of 3+ characters.
+INVENTORY_FTS = "inventory_fts"
+# Every text column the inventory browser's filter searches; inv_search narrows to its own five
+INVENTORY_FTS_COLS = [
+    "part_key", "sku", "vendor", "description", "desc_clean",
+    "label_line1", "label_line2", "label_short", "purchase_url", "last_invoice",
+]
+INVENTORY_SEARCH_COLS = ["part_key", "sku", "vendor", "description", "label_short"]
+
+_fts_ready: dict[Path, bool] = {}
+
+
+def ensure_inventory_fts(db: DB) -> bool:
+    """Create/sync the inventory FTS index if needed. Returns False when FTS5 isn't usable."""
+    if db.path in _fts_ready:
+        return _fts_ready[db.path]
+
+    ok = False
+    if _table_exists(db, "parts_received"):
+        con = db.connect()
+        try:
+            # One transaction: never leave an index behind without its sync triggers
+            con.execute("BEGIN IMMEDIATE")
+            _create_inventory_fts(con)
+            con.commit()
+            ok = True
+        except Exception:
+            con.rollback()
+            ok = False  # SQLite built without FTS5/trigram: callers fall back to LIKE
+        finally:
+            con.close()
+    _fts_ready[db.path] = ok
+    return ok
+
+
+def _create_inventory_fts(con) -> None:
+    if con.execute("SELECT 1 FROM sqlite_master WHERE name = ?", [INVENTORY_FTS]).fetchone():
+        have = [r[1] for r in con.execute(f"PRAGMA table_info({INVENTORY_FTS})")]
+        if have == INVENTORY_FTS_COLS:
+            return
+        # Index from an older column set: rebuild it (and its triggers) with the current columns
+        for suffix in ("ai", "ad", "au"):
+            con.execute(f"DROP TRIGGER IF EXISTS {INVENTORY_FTS}_{suffix}")
+        con.execute(f"DROP TABLE {INVENTORY_FTS}")
+
+    cols = ", ".join(INVENTORY_FTS_COLS)
+    new_cols = ", ".join(f"new.{c}" for c in INVENTORY_FTS_COLS)
+    old_cols = ", ".join(f"old.{c}" for c in INVENTORY_FTS_COLS)
+
+    con.execute(f"""
+        CREATE VIRTUAL TABLE {INVENTORY_FTS} USING fts5(
+            {cols}, content='parts_received', tokenize='trigram'
+        )
+    """)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {INVENTORY_FTS}_ai AFTER INSERT ON parts_received BEGIN
+            INSERT INTO {INVENTORY_FTS}(rowid, {cols}) VALUES (new.rowid, {new_cols});
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {INVENTORY_FTS}_ad AFTER DELETE ON parts_received BEGIN
+            INSERT INTO {INVENTORY_FTS}({INVENTORY_FTS}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {INVENTORY_FTS}_au AFTER UPDATE ON parts_received BEGIN
+            INSERT INTO {INVENTORY_FTS}({INVENTORY_FTS}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+            INSERT INTO {INVENTORY_FTS}(rowid, {cols}) VALUES (new.rowid, {new_cols});
+        END
+    """)
+    # Index rows that existed before the FTS table did
+    con.execute(f"INSERT INTO {INVENTORY_FTS}({INVENTORY_FTS}) VALUES ('rebuild')")
+
+
+def fts_phrase(term: str, cols: list[str] | None = None) -> str:
+    """
+    Quote a user term as a single FTS5 phrase (substring match under the trigram tokenizer),
+    optionally limited to some of the index's columns: {a b} : "term".
+    """
+    phrase = '"' + term.replace('"', '""') + '"'
+    return "{" + " ".join(cols) + "} : " + phrase if cols else phrase
+
+def fts_part_keys_sql() -> str:
+    """WHERE-clause fragment: part_key is among the FTS matches for one bound MATCH parameter."""
+    return f"part_key IN (SELECT part_key FROM {INVENTORY_FTS} WHERE {INVENTORY_FTS} MATCH ?)"
+
+
 def fmt_money(v) -> str:
+    if v is None:  # common for empty cost cells; skips the raised-and-caught TypeError
+        return ""
     try:
         return f"{float(v):,.2f}"
     except (TypeError, ValueError):
         return ""
 
 def shorten(s: str, n: int = 54) -> str:
-    s = safe_str(s)
+    if s is None:
+        return ""
+    if not isinstance(s, str):
+        s = str(s)
     return s if len(s) <= n else s[: n - 1] + "…"
 
 def parse_row_spec(spec: str) -> list[int]:
@@ -177,13 +360,8 @@ def parse_row_spec(spec: str) -> list[int]:
         else:
             out.append(int(part))
 
-    seen = set()
-    uniq: list[int] = []
-    for n in out:
-        if n not in seen:
-            uniq.append(n)
-            seen.add(n)
-    return uniq
+    # first occurrence wins, order kept (dict.fromkeys dedups in C; big ranges stay cheap)
+    return list(dict.fromkeys(out))
 
 def timestamp_slug() -> str:
     # local time is fine for filenames
@@ -212,8 +390,64 @@ def seed_label_templates() -> int:
     return copied
 
 # ----------------------------
-# Ingest runner (subprocess)
+# Ingest runner (in-process, subprocess fallback)
 # ----------------------------
+# module -> entry function; each returns the same exit code `python -m <module>` would
+INGEST_ENTRYPOINTS = {
+    "studio_inventory.main": "main",
+    "studio_inventory.ingest_all": "cli",
+}
+
+
+def run_module_in_process(module_name: str) -> int:
+    """
+    Import <module_name> and call its entry function from the workspace root, as
+    `python -m` would, without starting a new interpreter (pandas/pdf imports stay warm
+    across runs). A module without an entry function runs its `__main__` block via runpy
+    (still in-process); one that can't be imported falls back to run_module_in_subprocess().
+    STUDIO_INV_INGEST_SUBPROCESS=1 always uses the subprocess (full isolation).
+    Returns the entry's exit code.
+    """
+    if os.getenv("STUDIO_INV_INGEST_SUBPROCESS") == "1":
+        return run_module_in_subprocess(module_name)
+    try:
+        mod = importlib.import_module(module_name)
+    except ImportError as e:
+        console.print(f"[dim]In-process import failed ({e}); using a subprocess.[/dim]")
+        return run_module_in_subprocess(module_name)
+
+    entry_name = INGEST_ENTRYPOINTS.get(module_name, "main")
+    entry = getattr(mod, entry_name, None)
+    label = f"{module_name}.{entry_name}()"
+    if not callable(entry):
+        import runpy
+
+        def entry():
+            sys.modules.pop(module_name, None)  # run a fresh copy, as `python -m` would
+            runpy.run_module(module_name, run_name="__main__", alter_sys=True)
+        label = f"{module_name} (as __main__)"
+
+    console.print(f"\n[dim]Running:[/dim] {label}")
+    prev_cwd = os.getcwd()
+    try:
+        os.chdir(workspace_root())
+        rc = entry()
+    except SystemExit as e:
+        rc = e.code
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Cancelled.[/yellow]")
+        return 130
+    except Exception as e:
+        console.print(f"[red]{module_name} raised {type(e).__name__}:[/red] {e}")
+        return 1
+    finally:
+        os.chdir(prev_cwd)
+
+    if rc is None:
+        return 0
+    return rc if isinstance(rc, int) else 1
+
+
 def run_module_in_subprocess(module_name: str) -> int:
     """
     Run: python -m <module_name> from project root, so relative paths behave.
@@ -233,14 +467,16 @@ def run_module_in_subprocess(module_name: str) -> int:
         return 130
 
 def run_ingest() -> None:
-    """Run the ingest entrypoint in a subprocess.
+    """Run the ingest entrypoint (in-process; see run_module_in_process).
 
-    Return codes (child process):
+    Return codes (entry function):
       - 0   success (DB updated)
       - 2   cancelled / dry-run (DB not updated)
       - 130 interrupted (Ctrl+C)
     """
-    rc = run_module_in_subprocess("studio_inventory.main")
+    # The ingest may add columns; drop cached schemas whatever the outcome.
+    clear_schema_cache()
+    rc = run_module_in_process("studio_inventory.main")
     if rc == 0:
         console.print("[green]Ingest completed.[/green]")
         return
@@ -250,7 +486,8 @@ def run_ingest() -> None:
 
     console.print(f"[yellow]studio_inventory.main exited with code {rc}. Trying fallback…[/yellow]")
 
-    rc2 = run_module_in_subprocess("studio_inventory.ingest_all")
+    clear_schema_cache()
+    rc2 = run_module_in_process("studio_inventory.ingest_all")
     if rc2 == 0:
         console.print("[green]Ingest completed.[/green]")
         return
@@ -263,9 +500,34 @@ def run_ingest() -> None:
 # ----------------------------
 # Export helpers
 # ----------------------------
-def object_columns(db: DB, name: str) -> list[str]:
-    info = db.rows(f"PRAGMA table_info({name})")
-    return [r["name"] for r in info]
+# (db path, object name) -> column names. Cleared whenever this process may have changed
+# the schema (ALTER/init/reset) or after an ingest run (which adds columns dynamically).
+_SCHEMA_CACHE: dict[tuple[Path, str], list[str]] = {}
+
+def clear_schema_cache() -> None:
+    _SCHEMA_CACHE.clear()
+
+def object_columns(db: DB, name: str, con: Optional[sqlite3.Connection] = None) -> list[str]:
+    """Column names of a table/view; `con` reads on that connection instead of db.conn (e.g. from a worker thread)."""
+    key = (db.path, name)
+    cols = _SCHEMA_CACHE.get(key)
+    if cols is None:
+        info = (con if con is not None else db.conn).execute(f"PRAGMA table_info({name})").fetchall()
+        cols = [r[1] for r in info]  # (cid, name, type, notnull, dflt_value, pk)
+        if cols:  # don't remember "missing"; the object may be created later
+            _SCHEMA_CACHE[key] = cols
+    return list(cols)
+
+def quote_ident(name: str) -> str:
+    """Quote a table/view name for SQL (names can't be bound as ? parameters)."""
+    return '"' + name.replace('"', '""') + '"'
+
+# 1 MB buffer under the CSV text stream (default is 8 KB): far fewer write() syscalls on big exports
+CSV_WRITE_BUFFER = 1 << 20
+
+# gzip level for compressed exports: level 1 is several times faster than the default 9 and
+# still shrinks typical CSV text 3-5x
+EXPORT_GZIP_LEVEL = 1
 
 def export_sqlite_object_to_csv(
     db: DB,
@@ -273,27 +535,110 @@ def export_sqlite_object_to_csv(
     out_path: Path,
     order_by: Optional[str] = None,
     limit: Optional[int] = None,
+    con: Optional[sqlite3.Connection] = None,
+    compress: bool = False,
 ) -> None:
-    cols = object_columns(db, name)
-    if not cols:
-        raise RuntimeError(f"Could not read columns for {name}")
+    """
+    Write a table/view to CSV. Pass `con` (e.g. from db.read_transaction()) to read on a shared connection.
+    compress=True writes gzip instead, to <out_path>.gz.
+    """
+    if compress:
+        out_path = out_path.with_name(out_path.name + ".gz")
 
-    sql = f"SELECT * FROM {name}"
+    sql = f"SELECT * FROM {quote_ident(name)}"
     if order_by:
         sql += f" ORDER BY {order_by}"
     if limit:
         sql += f" LIMIT {int(limit)}"
 
-    rows = db.rows(sql)
-
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(cols)
-        for r in rows:
-            w.writerow([r[c] for c in cols])
+    # Stream off the session's shared connection unless the caller passed its own.
+    # Plain tuples instead of sqlite3.Row: csv.writer takes them as-is (no per-row wrapper).
+    cur = (con if con is not None else db.conn).cursor()
+    cur.row_factory = None
+    try:
+        try:
+            rows = cur.execute(sql)
+        except sqlite3.OperationalError as e:
+            raise RuntimeError(f"Could not read {name}: {e}") from e
+        # Header straight from the prepared SELECT: no separate PRAGMA table_info round-trip
+        cols = [d[0] for d in cur.description]
+        if compress:
+            import gzip
+
+            f = gzip.open(out_path, "wt", compresslevel=EXPORT_GZIP_LEVEL, newline="", encoding="utf-8")
+        else:
+            f = open(out_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER)
+        with f:
+            w = csv.writer(f)
+            w.writerow(cols)
+            n_rows = 0
+            for row in rows:
+                w.writerow(row)
+                n_rows += 1
+    finally:
+        cur.close()  # an unfinished SELECT would otherwise keep its read snapshot open
+
+    console.print(f"[green]Exported[/green] {name} → [cyan]{out_path}[/cyan] ({n_rows} rows)")
+
+# (object, csv file name, ORDER BY) for "Export ALL"
+EXPORT_ALL_OBJECTS: list[tuple[str, str, str]] = [
+    ("inventory_view", "inventory_view.csv", "vendor, sku"),
+    ("orders", "orders.csv", "vendor, order_date"),
+    ("line_items", "line_items.csv", "vendor, invoice, line_item_uid"),
+    ("parts_received", "parts_received.csv", "vendor, sku"),
+    ("parts_removed", "parts_removed.csv", "ts_utc DESC"),
+    ("ingested_files", "ingested_files.csv", "first_seen_utc DESC"),
+]
 
-    console.print(f"[green]Exported[/green] {name} → [cyan]{out_path}[/cyan] ({len(rows)} rows)")
+# Export ALL: tables are independent files, and sqlite3 releases the GIL while stepping
+EXPORT_ALL_WORKERS = 4
+
+def _export_object_in_own_snapshot(
+    db: DB, name: str, out_path: Path, order_by: Optional[str], compress: bool = False
+) -> None:
+    # sqlite3 connections are per-thread: each worker reads through its own read transaction
+    with db.read_transaction() as con:
+        export_sqlite_object_to_csv(db, name, out_path, order_by=order_by, con=con, compress=compress)
+
+def export_objects_parallel(
+    db: DB,
+    outdir: Path,
+    objects: list[tuple[str, str, str]],
+    max_workers: int = EXPORT_ALL_WORKERS,
+    compress: bool = False,
+) -> None:
+    """
+    Export several objects concurrently, one thread + connection per object (WAL readers don't
+    block each other). Raises RuntimeError naming every object that failed.
+
+    On a single core threads only contend, so the objects are exported in order inside one
+    read transaction instead (which also keeps them consistent with each other).
+    """
+    max_workers = min(max_workers, os.cpu_count() or 1, len(objects))
+    if max_workers <= 1:
+        with db.read_transaction() as con:
+            for name, filename, order_by in objects:
+                export_sqlite_object_to_csv(
+                    db, name, outdir / filename, order_by=order_by, con=con, compress=compress
+                )
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed  # only needed here (~8 ms to import)
+
+    errors: list[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_export_object_in_own_snapshot, db, name, outdir / filename, order_by, compress): name
+            for name, filename, order_by in objects
+        }
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+            except Exception as e:
+                errors.append(f"{futures[fut]}: {e}")
+    if errors:
+        raise RuntimeError("; ".join(sorted(errors)))
 
 # ----------------------------
 # Menu-first entry
@@ -309,15 +654,15 @@ def run_menu():
         console.clear()
         header()
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "[bold]Orders[/bold] | ingest/review: receipts / packing lists")
-        menu.add_row("2.", "[bold]Export[/bold] | make: data (CSV / reports)")
-        menu.add_row("3.", "[bold]Inventory[/bold] | browse / search / receive / remove")
-        menu.add_row("4.", "[bold]Vendors[/bold] | enrich: (DigiKey / McMaster) [dim](coming soon)[/dim]")
-        menu.add_row("5.", "[bold]Labels[/bold] | generate PDFs")
-        menu.add_row("6.", "DB diagnostics")
-        menu.add_row("0.", "Quit")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "[bold]Orders[/bold] | ingest/review: receipts / packing lists"),
+            ("2.", "[bold]Export[/bold] | make: data (CSV / reports)"),
+            ("3.", "[bold]Inventory[/bold] | browse / search / receive / remove"),
+            ("4.", "[bold]Vendors[/bold] | enrich: (DigiKey / McMaster) [dim](coming soon)[/dim]"),
+            ("5.", "[bold]Labels[/bold] | generate PDFs"),
+            ("6.", "DB diagnostics"),
+            ("0.", "Quit"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "2", "3", "4", "5", "6", "0"], default="3")
 
@@ -334,6 +679,7 @@ def run_menu():
         elif choice == "6":
             menu_db_diagnostics()
         elif choice == "0":
+            close_dbs()
             console.print("\nBye.\n")
             return
 
@@ -350,12 +696,12 @@ def menu_ingest():
         header()
         console.print("[bold]Ingest[/bold]\n")
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Run ingest")
-        menu.add_row("2.", "Browse orders / receipts")
-        menu.add_row("3.", "Show recent ingested files")
-        menu.add_row("0.", "Back")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "Run ingest"),
+            ("2.", "Browse orders / receipts"),
+            ("3.", "Show recent ingested files"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "2", "3", "0"], default="1")
         if choice == "0":
@@ -400,14 +746,13 @@ def show_recent_ingests(db: DB):
     t.add_column("archived", width=7)
     t.add_column("original_path")
 
-    for r in rows:
-        archived = safe_str(row_get(r, "archived_path"))
+    for first_seen_utc, vendor, order_ref, original_path, archived_path in rows:
         t.add_row(
-            safe_str(row_get(r, "first_seen_utc")),
-            safe_str(row_get(r, "vendor")),
-            safe_str(row_get(r, "order_ref")),
-            "✅" if archived else "",
-            shorten(row_get(r, "original_path"), 80),
+            "" if first_seen_utc is None else str(first_seen_utc),
+            "" if vendor is None else str(vendor),
+            "" if order_ref is None else str(order_ref),
+            "✅" if safe_str(archived_path) else "",
+            shorten(original_path, 80),
         )
 
     console.print(t)
@@ -454,21 +799,25 @@ def _orders_filter_prompt(filters: dict[str, str]) -> dict[str, str]:
     return {"vendor": norm(vendor), "order_id": norm(order_id), "date": norm(date)}
 
 
-def _orders_sort_prompt() -> str:
+# Sort choices as (expression, descending) keys for sort_keys_sql / seek_after_sql; each ends in
+# the unique order_uid so every row has a distinct position (keyset paging needs one)
+ORDERS_SORT_KEYS: dict[str, list[tuple[str, bool]]] = {
+    # Newest ingested (first_seen_utc is ISO)
+    "1": [("(i.first_seen_utc IS NULL)", False), ("i.first_seen_utc", True), ("o.order_uid", True)],
+    "2": [("o.vendor", False), ("o.order_id", False), ("o.order_uid", False)],
+    "3": [("COALESCE(o.total, 0)", True), ("o.vendor", False), ("o.order_uid", False)],
+    "4": [("COALESCE(o.order_date, '')", True), ("o.vendor", False), ("o.order_id", False), ("o.order_uid", False)],
+}
+
+
+def _orders_sort_prompt() -> list[tuple[str, bool]]:
     console.print("\n[bold]Sort orders[/bold]")
     console.print("  1) newest ingested (default)")
     console.print("  2) vendor, order")
     console.print("  3) total desc")
     console.print("  4) date desc")
     choice = Prompt.ask("Choose", choices=["1","2","3","4"], default="1")
-    if choice == "2":
-        return "o.vendor, o.order_id"
-    if choice == "3":
-        return "COALESCE(o.total, 0) DESC, o.vendor"
-    if choice == "4":
-        return "COALESCE(o.order_date, '') DESC, o.vendor, o.order_id"
-    # Newest ingested (first_seen_utc is ISO)
-    return "(i.first_seen_utc IS NULL), i.first_seen_utc DESC, o.order_uid DESC"
+    return ORDERS_SORT_KEYS[choice]
 
 
 def orders_browse(db: DB, *, page_size: int = 20) -> None:
@@ -484,9 +833,15 @@ def orders_browse(db: DB, *, page_size: int = 20) -> None:
         return
 
     filters = {"vendor": "", "order_id": "", "date": ""}
-    order_by = "(i.first_seen_utc IS NULL), i.first_seen_utc DESC, o.order_uid DESC"
+    sort_keys = ORDERS_SORT_KEYS["1"]
     page = 0
 
+    # As in inv_browse: COUNT once per filter, and each page's seek key (sort values of the
+    # previous page's last row), so n/p cost O(page size) at any depth. Reset on filter/sort
+    # changes and after the details screen (which can void/delete orders).
+    total: int | None = None
+    page_starts: dict[int, tuple | None] = {0: None}
+
     while True:
         console.clear()
         header()
@@ -494,20 +849,35 @@ def orders_browse(db: DB, *, page_size: int = 20) -> None:
 
         where, params = _orders_where(filters)
 
-        try:
-            total = int(db.scalar(
-                f"SELECT COUNT(*) FROM orders o LEFT JOIN ingested_files i ON i.file_hash = o.file_hash {where}",
-                params,
-            ) or 0)
-        except Exception as e:
-            console.print(f"[red]Query failed:[/red] {e}")
-            pause()
-            return
+        if total is None:
+            try:
+                total = int(db.scalar(
+                    f"SELECT COUNT(*) FROM orders o LEFT JOIN ingested_files i ON i.file_hash = o.file_hash {where}",
+                    params,
+                ) or 0)
+            except Exception as e:
+                console.print(f"[red]Query failed:[/red] {e}")
+                pause()
+                return
 
         max_page = 0 if total == 0 else (total - 1) // page_size
         page = max(0, min(page, max_page))
-        offset = page * page_size
 
+        page_params = list(params)
+        if page in page_starts:
+            start = page_starts[page]
+            if start is not None:
+                seek, seek_params = seek_after_sql(sort_keys, start)
+                where = _combine_where(where, seek)
+                page_params += seek_params
+            offset_sql = ""
+        else:
+            offset_sql = "OFFSET ?"  # not walked to yet: OFFSET once
+        page_params.append(page_size)
+        if offset_sql:
+            page_params.append(page * page_size)
+
+        sort_cols = ", ".join(f"{expr} AS _sort{k}" for k, (expr, _) in enumerate(sort_keys))
         sql = f"""
             SELECT
                 o.order_uid,
@@ -520,15 +890,18 @@ def orders_browse(db: DB, *, page_size: int = 20) -> None:
                 i.first_seen_utc,
                 COALESCE(o.archived_path, i.archived_path) AS archived_path,
                 COALESCE(o.original_path, i.original_path) AS original_path,
-                COALESCE(o.order_ref, i.order_ref) AS order_ref
+                COALESCE(o.order_ref, i.order_ref) AS order_ref,
+                {sort_cols}
             FROM orders o
             LEFT JOIN ingested_files i ON i.file_hash = o.file_hash
             {where}
-            ORDER BY {order_by}
-            LIMIT ? OFFSET ?
+            ORDER BY {sort_keys_sql(sort_keys)}
+            LIMIT ? {offset_sql}
         """
 
-        rows = db.rows(sql, params + [page_size, offset])
+        rows = db.rows(sql, page_params)
+        if len(rows) == page_size:
+            page_starts[page + 1] = tuple(rows[-1][f"_sort{k}"] for k in range(len(sort_keys)))
 
         t = Table(show_header=True, header_style="bold magenta")
         t.add_column("#", justify="right", width=4)
@@ -568,17 +941,18 @@ def orders_browse(db: DB, *, page_size: int = 20) -> None:
             continue
         if cmd in {"f", "filter"}:
             filters = _orders_filter_prompt(filters)
-            page = 0
+            page, total, page_starts = 0, None, {0: None}
             continue
         if cmd in {"s", "sort"}:
-            order_by = _orders_sort_prompt()
-            page = 0
+            sort_keys = _orders_sort_prompt()
+            page, total, page_starts = 0, None, {0: None}
             continue
 
         if cmd.isdigit():
             idx = int(cmd)
             if 1 <= idx <= len(rows):
                 _show_order_details(db, rows[idx - 1]["order_uid"])
+                total, page_starts = None, {0: None}
             else:
                 console.print("[yellow]Row out of range.[/yellow]")
                 pause()
@@ -757,7 +1131,7 @@ def _void_order_to_parts_removed(db: DB, order_uid: str) -> int:
     ts = utc_now_iso()
     ensure_inventory_events_table(db)
 
-    with db.connect() as con:
+    with db.conn as con:
         con.execute("PRAGMA foreign_keys = ON;")
 
         o = con.execute(
@@ -839,7 +1213,7 @@ def _undo_void_order(db: DB, order_uid: str) -> int:
     ts = utc_now_iso()
     ensure_inventory_events_table(db)
 
-    with db.connect() as con:
+    with db.conn as con:
         con.execute("PRAGMA foreign_keys = ON;")
 
         o = con.execute(
@@ -902,7 +1276,7 @@ def _purge_order_and_rebuild(db: DB, order_uid: str) -> None:
 
     This is the "I want to ingest again" path.
     """
-    with db.connect() as con:
+    with db.conn as con:
         con.execute("PRAGMA foreign_keys = ON;")
         row = con.execute("SELECT file_hash FROM orders WHERE order_uid = ?", [order_uid]).fetchone()
         file_hash = None if row is None else row[0]
@@ -940,9 +1314,7 @@ def _delete_order_and_rebuild(db: DB, order_uid: str) -> None:
 
 
 def _rebuild_parts_received_and_inventory(con) -> None:
-    from datetime import datetime, timezone
-
-    ts = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    ts = utc_now_iso()
 
     # Rebuild parts_received from current line_items
     con.execute("DELETE FROM parts_received;")
@@ -1014,25 +1386,31 @@ def menu_export():
         pause()
         return
 
+    compress = False  # sticky for the session's export menu
+
     while True:
         console.clear()
         header()
         console.print("[bold]Export[/bold]\n")
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Export inventory_view (recommended)")
-        menu.add_row("2.", "Export orders")
-        menu.add_row("3.", "Export line_items")
-        menu.add_row("4.", "Export parts_received")
-        menu.add_row("5.", "Export parts_removed")
-        menu.add_row("6.", "Export ingested_files")
-        menu.add_row("7.", "Export ALL of the above")
-        menu.add_row("0.", "Back")
-        console.print(menu)
-
-        choice = Prompt.ask("\nChoose", choices=[str(i) for i in range(0, 8)], default="1")
+        console.print(menu_table(
+            ("1.", "Export inventory_view (recommended)"),
+            ("2.", "Export orders"),
+            ("3.", "Export line_items"),
+            ("4.", "Export parts_received"),
+            ("5.", "Export parts_removed"),
+            ("6.", "Export ingested_files"),
+            ("7.", "Export ALL of the above"),
+            ("c.", f"Export compressed (.csv.gz): [cyan]{'on' if compress else 'off'}[/cyan]"),
+            ("0.", "Back"),
+        ))
+
+        choice = Prompt.ask("\nChoose", choices=[str(i) for i in range(0, 8)] + ["c"], default="1")
         if choice == "0":
             return
+        if choice == "c":
+            compress = not compress
+            continue
 
         slug = timestamp_slug()
         outdir = exports_dir() / f"export_{slug}"
@@ -1045,34 +1423,35 @@ def menu_export():
                     "inventory_view",
                     outdir / "inventory_view.csv",
                     order_by="vendor, sku",
+                    compress=compress,
                 )
             elif choice == "2":
                 export_sqlite_object_to_csv(
-                    db, "orders", outdir / "orders.csv", order_by="vendor, order_date"
+                    db, "orders", outdir / "orders.csv", order_by="vendor, order_date",
+                    compress=compress,
                 )
             elif choice == "3":
                 export_sqlite_object_to_csv(
-                    db, "line_items", outdir / "line_items.csv", order_by="vendor, invoice, line_item_uid"
+                    db, "line_items", outdir / "line_items.csv", order_by="vendor, invoice, line_item_uid",
+                    compress=compress,
                 )
             elif choice == "4":
                 export_sqlite_object_to_csv(
-                    db, "parts_received", outdir / "parts_received.csv", order_by="vendor, sku"
+                    db, "parts_received", outdir / "parts_received.csv", order_by="vendor, sku",
+                    compress=compress,
                 )
             elif choice == "5":
                 export_sqlite_object_to_csv(
-                    db, "parts_removed", outdir / "parts_removed.csv", order_by="ts_utc DESC"
+                    db, "parts_removed", outdir / "parts_removed.csv", order_by="ts_utc DESC",
+                    compress=compress,
                 )
             elif choice == "6":
                 export_sqlite_object_to_csv(
-                    db, "ingested_files", outdir / "ingested_files.csv", order_by="first_seen_utc DESC"
+                    db, "ingested_files", outdir / "ingested_files.csv", order_by="first_seen_utc DESC",
+                    compress=compress,
                 )
             elif choice == "7":
-                export_sqlite_object_to_csv(db, "inventory_view", outdir / "inventory_view.csv", order_by="vendor, sku")
-                export_sqlite_object_to_csv(db, "orders", outdir / "orders.csv", order_by="vendor, order_date")
-                export_sqlite_object_to_csv(db, "line_items", outdir / "line_items.csv", order_by="vendor, invoice, line_item_uid")
-                export_sqlite_object_to_csv(db, "parts_received", outdir / "parts_received.csv", order_by="vendor, sku")
-                export_sqlite_object_to_csv(db, "parts_removed", outdir / "parts_removed.csv", order_by="ts_utc DESC")
-                export_sqlite_object_to_csv(db, "ingested_files", outdir / "ingested_files.csv", order_by="first_seen_utc DESC")
+                export_objects_parallel(db, outdir, EXPORT_ALL_OBJECTS, compress=compress)
 
             console.print(f"\n[cyan]Export folder:[/cyan] {outdir}")
         except Exception as e:
@@ -1091,21 +1470,23 @@ def menu_inventory():
         console.print(f"[red]DB not found:[/red] {db.path}")
         pause()
         return
+    ensure_inventory_indexes(db)
+    ensure_inventory_view(db)
 
     while True:
         console.clear()
         header()
         console.print("[bold]Inventory[/bold] (from [cyan]inventory_view[/cyan])\n")
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "List (top 30)")
-        menu.add_row("2.", "Search")
-        menu.add_row("3.", "Show details (by part_key)")
-        menu.add_row("4.", "Receive stock (manual)")
-        menu.add_row("5.", "Remove stock (log usage)")
-        menu.add_row("6.", "Edit label fields (line1/line2/short/QR/url)")
-        menu.add_row("0.", "Back")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "List (top 30)"),
+            ("2.", "Search"),
+            ("3.", "Show details (by part_key)"),
+            ("4.", "Receive stock (manual)"),
+            ("5.", "Remove stock (log usage)"),
+            ("6.", "Edit label fields (line1/line2/short/QR/url)"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "2", "3", "4", "5", "6", "0"], default="2")
         if choice == "0":
@@ -1126,6 +1507,65 @@ def menu_inventory():
 def inv_list(db: DB):
         inv_browse(db, title="Inventory (all)", order_by="vendor, sku")
 
+# ----------------------------
+# Keyset (seek) paging for inv_browse
+# ----------------------------
+# Columns inv_browse selects; only these can drive a seek predicate
+BROWSE_COLUMNS = ["part_key", "vendor", "sku", "label_short", "on_hand", "avg_unit_cost", "last_invoice"]
+
+def parse_sort_keys(order_by: str) -> list[tuple[str, bool]] | None:
+    """
+    "on_hand DESC, vendor, sku" -> [("on_hand", True), ("vendor", False), ("sku", False), ("part_key", False)].
+    part_key (unique) is appended as the tie-breaker so every row has a distinct position.
+    Returns None when a term isn't a plain browse column (callers then page with OFFSET).
+    """
+    keys: list[tuple[str, bool]] = []
+    for term in order_by.split(","):
+        parts = term.split()
+        if not parts or len(parts) > 2 or parts[0] not in BROWSE_COLUMNS:
+            return None
+        if len(parts) == 2 and parts[1].upper() not in ("ASC", "DESC"):
+            return None
+        keys.append((parts[0], len(parts) == 2 and parts[1].upper() == "DESC"))
+    if all(col != "part_key" for col, _ in keys):
+        keys.append(("part_key", False))
+    return keys
+
+def sort_keys_sql(keys: list[tuple[str, bool]]) -> str:
+    return ", ".join(f"{col} DESC" if desc else col for col, desc in keys)
+
+def seek_after_sql(keys: list[tuple[str, bool]], last: tuple) -> tuple[str, list]:
+    """
+    Predicate for "rows after `last`" in ORDER BY `keys`, NULL-aware (SQLite sorts NULLs
+    first ascending, last descending):
+      (k1 after v1) OR (k1 IS v1 AND k2 after v2) OR ...
+    """
+    ors: list[str] = []
+    params: list = []
+    eq_sql: list[str] = []
+    eq_params: list = []
+    for (col, desc), val in zip(keys, last):
+        if val is None:
+            after, after_params = (None, []) if desc else (f"{col} IS NOT NULL", [])
+        elif desc:
+            after, after_params = f"({col} < ? OR {col} IS NULL)", [val]
+        else:
+            after, after_params = f"{col} > ?", [val]
+        if after is not None:
+            ors.append("(" + " AND ".join(eq_sql + [after]) + ")")
+            params.extend(eq_params + after_params)
+        eq_sql.append(f"{col} IS ?")
+        eq_params.append(val)
+    if not ors:
+        return "0", params
+    pred = "(" + " OR ".join(ors) + ")"
+    (col, desc), val = keys[0], last[0]
+    if val is not None and not desc:
+        # Redundant with the ORs, but a plain range SQLite can seek an index on the first key with
+        # (the OR form alone scans from the start). DESC would need "OR col IS NULL", which can't.
+        return f"{col} >= ? AND {pred}", [val] + params
+    return pred, params
+
 def inv_browse(
     db: DB,
     where_sql: str | None = None,
@@ -1133,11 +1573,13 @@ def inv_browse(
     title: str = "Inventory browse",
     order_by: str = "vendor, sku",
     allow_select: bool = False,
+    like_fallback: tuple[str, list] | None = None,
 ) -> Any:
     """
     Paged browser for inventory_view.
     - where_sql: e.g. "WHERE vendor LIKE ? OR sku LIKE ?"
     - params: matching parameters for where_sql
+    - like_fallback: (where_sql, params) used instead when where_sql's FTS index turns out missing
     When allow_select=True, user can type: sel 87:200,205,206
     and this function returns a dict describing the selection context.
     """
@@ -1165,32 +1607,141 @@ def inv_browse(
             return base_where.rstrip() + " AND " + dyn_where.strip() + " "
         return " WHERE " + dyn_where.strip() + " "
 
-    def total_rows() -> int:
-        return int(
-            db.scalar(
-                f"SELECT COUNT(*) FROM inventory_view{_combined_where()}",
-                params + dyn_params
-            ) or 0
-        )
-
-    def fetch_page(p: int, ps: int):
-        offset = (p - 1) * ps
-        sql = f"""
+    def _apply_filters() -> None:
+        """Rebuild dyn_where/dyn_params from the sticky filter state."""
+        nonlocal dyn_where, dyn_params
+        clauses = []
+        new_params: list = []
+
+        if flt_vendor:
+            clauses.append("vendor LIKE ? COLLATE NOCASE")
+            new_params.append(f"%{flt_vendor}%")
+
+        if flt_term and len(flt_term) >= 3 and ensure_inventory_fts(db):
+            # Indexed substring match over the same ten columns (trigram FTS)
+            clauses.append(fts_part_keys_sql())
+            new_params.append(fts_phrase(flt_term))
+        elif flt_term:
+            like = f"%{flt_term}%"
+            search_cols = [
+                "vendor", "sku", "part_key", "description", "desc_clean",
+                "label_line1", "label_line2", "label_short",
+                "purchase_url", "last_invoice",
+            ]
+            clauses.append(
+                "(" + " OR ".join([f"COALESCE({c}, '') LIKE ? COLLATE NOCASE" for c in search_cols]) + ")")
+            new_params.extend([like] * len(search_cols))
+
+        if flt_min_hand is not None:
+            clauses.append("on_hand >= ?")
+            new_params.append(flt_min_hand)
+
+        if flt_max_cost is not None:
+            clauses.append("avg_unit_cost <= ?")
+            new_params.append(flt_max_cost)
+
+        if flt_inv:
+            clauses.append("last_invoice LIKE ? COLLATE NOCASE")
+            new_params.append(f"%{flt_inv}%")
+
+        dyn_where = " AND ".join(clauses) if clauses else ""
+        dyn_params = new_params
+
+    # COUNT(*) per filter (not per redraw), and each page's seek key: page -> sort values of
+    # the previous page's last row. Both are reset whenever filter/sort/size or the data change.
+    count_cache: dict[tuple, int] = {}
+    page_starts: dict[int, tuple | None] = {1: None}
+
+    # SQL text per filter/sort state, built in _reset_paging (not per redraw): paging only varies
+    # the bound parameters, so the shared connection's statement cache reuses the compiled plans.
+    # The keyset "after" predicate differs only by which sort values are NULL, so its few
+    # variants are memoized too.
+    sql: dict[str, Any] = {}
+    seek_sql: dict[str, str] = {}
+
+    def _build_sql() -> None:
+        where = _combined_where()
+        keys = parse_sort_keys(order_by)
+        select = f"""
             SELECT part_key, vendor, sku, label_short, on_hand, avg_unit_cost, last_invoice
             FROM inventory_view
-            {_combined_where()}
-            ORDER BY {order_by}
-            LIMIT ? OFFSET ?
+            {{where}}
+            ORDER BY {sort_keys_sql(keys) if keys else order_by}
+            LIMIT ? {{offset}}
         """
-        return db.rows(sql, params + dyn_params + [ps, offset])
+        sql.clear()
+        seek_sql.clear()
+        sql["where"] = where
+        sql["keys"] = keys
+        sql["select"] = select
+        sql["count"] = f"SELECT COUNT(*) FROM inventory_view{where}"
+        sql["first"] = select.format(where=where, offset="")
+        sql["offset"] = select.format(where=where, offset="OFFSET ?")
+
+    # Rendered table + command line per page, reset with the rest of the paging state. Rendering
+    # the Rich table is most of a redraw; flipping back to a page (or a key that leaves it as it
+    # was) re-emits the stored segments instead.
+    frames: dict[tuple, Segments] = {}
+
+    def _reset_paging() -> None:
+        count_cache.clear()
+        page_starts.clear()
+        page_starts[1] = None
+        frames.clear()
+        _build_sql()
+
+    _build_sql()
 
-    while True:
-        console.clear()
-        header()
-        console.print(f"[bold]{title}[/bold]\n")
+    def total_rows() -> int:
+        key = tuple(params + dyn_params)
+        if key not in count_cache:
+            count_cache[key] = int(db.scalar(sql["count"], params + dyn_params) or 0)
+        return count_cache[key]
 
-        total = total_rows()
+    def fetch_page(p: int, ps: int):
+        keys = sql["keys"]
+        if keys is None:
+            # Free-form ORDER BY: plain OFFSET paging
+            return db.rows(sql["offset"], params + dyn_params + [ps, (p - 1) * ps])
+
+        if p in page_starts:
+            # Seek past the previous page's last row: O(page size) at any depth
+            start = page_starts[p]
+            if start is None:
+                rows = db.rows(sql["first"], params + dyn_params + [ps])
+            else:
+                seek, seek_params = seek_after_sql(keys, start)
+                if seek not in seek_sql:
+                    seek_sql[seek] = sql["select"].format(where=_combine_where(sql["where"], seek), offset="")
+                rows = db.rows(seek_sql[seek], params + dyn_params + seek_params + [ps])
+        else:
+            # Jump (goto / row number) to a page we haven't walked to: OFFSET once
+            rows = db.rows(sql["offset"], params + dyn_params + [ps, (p - 1) * ps])
+        if len(rows) == ps:
+            page_starts[p + 1] = tuple(rows[-1][col] for col, _ in keys)
+        return rows
+
+    while True:
+        try:
+            total = total_rows()
+        except sqlite3.OperationalError:
+            if INVENTORY_FTS not in sql["where"]:
+                raise
+            # The FTS index is gone (e.g. the DB was recreated under us): search with LIKE instead
+            _fts_ready[db.path] = False
+            if INVENTORY_FTS in base_where:
+                if like_fallback is None:
+                    raise
+                base_where = f" {like_fallback[0]} "
+                params = list(like_fallback[1])
+            _apply_filters()
+            page = 1
+            _reset_paging()
+            continue
         if total == 0:
+            console.clear()
+            header()
+            console.print(f"[bold]{title}[/bold]\n")
             console.print("[yellow]No rows found.[/yellow]")
             pause()
             return None
@@ -1198,43 +1749,52 @@ def inv_browse(
         max_page = max(1, (total + page_size - 1) // page_size)
         page = max(1, min(page, max_page))
 
-        rows = fetch_page(page, page_size)
+        frame_key = (page, page_size, console.width)
+        frame = frames.get(frame_key)
+        if frame is None:
+            rows = fetch_page(page, page_size)
+
+            t = Table(show_header=True, header_style="bold magenta")
+            t.add_column("#", justify="right", style="dim", width=4)
+            t.add_column("vendor", width=20)
+            t.add_column("sku", width=16)
+            t.add_column("label_short")
+            t.add_column("on_hand", justify="right", width=8)
+            t.add_column("avg_cost", justify="right", width=10)
+
+            # Positional unpacking (fetch_page's column order) instead of a Row key lookup per cell
+            first_row_num = (page - 1) * page_size + 1
+            for row_num, (_pk, vendor, sku, label_short, on_hand, avg_unit_cost, _inv) in enumerate(rows, first_row_num):
+                t.add_row(
+                    str(row_num),
+                    "" if vendor is None else str(vendor),
+                    "" if sku is None else str(sku),
+                    shorten(label_short, 60),
+                    "" if on_hand is None else str(on_hand),
+                    fmt_money(avg_unit_cost),
+                )
 
-        t = Table(show_header=True, header_style="bold magenta")
-        t.add_column("#", justify="right", style="dim", width=4)
-        t.add_column("vendor", width=20)
-        t.add_column("sku", width=16)
-        t.add_column("label_short")
-        t.add_column("on_hand", justify="right", width=8)
-        t.add_column("avg_cost", justify="right", width=10)
-
-        for i, r in enumerate(rows):
-            row_num = (page - 1) * page_size + i + 1
-            t.add_row(
-                str(row_num),
-                safe_str(r["vendor"]),
-                safe_str(r["sku"]),
-                shorten(r["label_short"], 60),
-                safe_str(r["on_hand"]),
-                fmt_money(r["avg_unit_cost"]),
+            cmd_line = (
+                f"\nPage [cyan]{page}[/cyan] / [cyan]{max_page}[/cyan]  |  "
+                f"Rows: [cyan]{total}[/cyan]  |  Page size: [cyan]{page_size}[/cyan]  |  "
+                f"Sort: [cyan]{order_by}[/cyan]\n"
+                "[dim]Commands:[/dim] "
+                "[bold]n[/bold] next  [bold]p[/bold] prev  [bold]g[/bold] goto  "
+                "[bold]s[/bold] size  "
+                "[bold]v[/bold] vendor  [bold]h[/bold] on_hand  [bold]c[/bold] cost  [bold]o[/bold] last_invoice  "
+                "[bold]f[/bold] filter  "
+                "[bold]q[/bold] back  [bold]<row#>[/bold] details"
             )
+            if allow_select:
+                cmd_line += "  [bold]sel <spec>[/bold] select rows"
+            frame = frames[frame_key] = Segments(list(console.render(Group(t, cmd_line))))
 
-        console.print(t)
-
-        cmd_line = (
-            f"\nPage [cyan]{page}[/cyan] / [cyan]{max_page}[/cyan]  |  "
-            f"Rows: [cyan]{total}[/cyan]  |  Page size: [cyan]{page_size}[/cyan]  |  "
-            f"Sort: [cyan]{order_by}[/cyan]\n"
-            "[dim]Commands:[/dim] "
-            "[bold]n[/bold] next  [bold]p[/bold] prev  [bold]g[/bold] goto  "
-            "[bold]s[/bold] size  "
-            "[bold]v[/bold] vendor  [bold]h[/bold] on_hand  [bold]c[/bold] cost  [bold]o[/bold] last_invoice  "
-            "[bold]f[/bold] filter  "
-            "[bold]q[/bold] back  [bold]<row#>[/bold] details"
-        )
-        if allow_select:
-            cmd_line += "  [bold]sel <spec>[/bold] select rows"
-        console.print(cmd_line)
+        # Console as a context manager buffers: the whole screen goes out in one write (no flicker)
+        with console:
+            console.clear()
+            header()
+            console.print(f"[bold]{title}[/bold]\n")
+            console.print(frame)
 
         cmd = Prompt.ask(">", default="n").strip()
         cmd_l = cmd.lower()
@@ -1258,23 +1818,28 @@ def inv_browse(
             if page_size not in page_sizes:
                 page_size = min(page_sizes, key=lambda x: abs(x - page_size))
             page = 1
+            _reset_paging()
 
         # sort hotkeys
         elif cmd_l == "v":
             order_by = "vendor, sku"
             page = 1
+            _reset_paging()
 
         elif cmd_l == "h":
             order_by = "on_hand DESC, vendor, sku"
             page = 1
+            _reset_paging()
 
         elif cmd_l == "c":
             order_by = "avg_unit_cost DESC, vendor, sku"
             page = 1
+            _reset_paging()
 
         elif cmd_l == "o":
             order_by = "last_invoice DESC"
             page = 1
+            _reset_paging()
 
         # filters
         elif cmd_l == "f":
@@ -1317,53 +1882,24 @@ def inv_browse(
                     except ValueError:
                         console.print("[yellow]Max avg_cost ignored (not a number).[/yellow]")
 
-            # Rebuild dyn_where from the sticky state
-            clauses = []
-            new_params: list = []
-
-            if flt_vendor:
-                clauses.append("vendor LIKE ? COLLATE NOCASE")
-                new_params.append(f"%{flt_vendor}%")
-
-            if flt_term:
-                like = f"%{flt_term}%"
-                search_cols = [
-                    "vendor", "sku", "part_key", "description", "desc_clean",
-                    "label_line1", "label_line2", "label_short",
-                    "purchase_url", "last_invoice",
-                ]
-                clauses.append(
-                    "(" + " OR ".join([f"COALESCE({c}, '') LIKE ? COLLATE NOCASE" for c in search_cols]) + ")")
-                new_params.extend([like] * len(search_cols))
-
-            if flt_min_hand is not None:
-                clauses.append("on_hand >= ?")
-                new_params.append(flt_min_hand)
-
-            if flt_max_cost is not None:
-                clauses.append("avg_unit_cost <= ?")
-                new_params.append(flt_max_cost)
-
-            if flt_inv:
-                clauses.append("last_invoice LIKE ? COLLATE NOCASE")
-                new_params.append(f"%{flt_inv}%")
-
-            dyn_where = " AND ".join(clauses) if clauses else ""
-            dyn_params = new_params
+            _apply_filters()
             page = 1
+            _reset_paging()
 
 
         # selection mode
         elif allow_select and cmd_l.startswith("sel"):
             spec = cmd[3:].strip()
             row_nums = parse_row_spec(spec)
+            keys = parse_sort_keys(order_by)
             return {
                 "row_nums": row_nums,
                 "base_where": base_where,
                 "base_params": params,
                 "dyn_where": dyn_where,
                 "dyn_params": dyn_params,
-                "order_by": order_by,
+                # same row numbering as the pages (incl. the part_key tie-breaker)
+                "order_by": sort_keys_sql(keys) if keys else order_by,
             }
 
         # Drill-in by absolute row number
@@ -1378,6 +1914,7 @@ def inv_browse(
             if 0 <= target_offset < len(rows):
                 part_key = rows[target_offset]["part_key"]
                 inv_show(db, part_key=part_key)
+                _reset_paging()  # the details screen can change stock
             continue
 
 def inv_search(db: DB):
@@ -1389,8 +1926,9 @@ def inv_search(db: DB):
     if not term:
         return
 
+    # Short terms (trigrams need 3+ chars) or no FTS5: plain substring scan
     like = f"%{term}%"
-    where_sql = """
+    like_where = """
     WHERE (
           part_key LIKE ? COLLATE NOCASE
        OR sku LIKE ? COLLATE NOCASE
@@ -1399,13 +1937,21 @@ def inv_search(db: DB):
        OR label_short LIKE ? COLLATE NOCASE
     )
     """
+    like_params = [like, like, like, like, like]
+
+    if len(term) >= 3 and ensure_inventory_fts(db):
+        where_sql = "WHERE " + fts_part_keys_sql()
+        params = [fts_phrase(term, INVENTORY_SEARCH_COLS)]
+    else:
+        where_sql, params = like_where, like_params
 
     inv_browse(
         db,
         where_sql=where_sql,
-        params=[like, like, like, like, like],
+        params=params,
         title=f"Search: {term}",
         order_by="on_hand DESC, vendor, sku",
+        like_fallback=(like_where, like_params),
     )
 
 def inv_show(db: DB, part_key: str | None = None):
@@ -1446,14 +1992,14 @@ def inv_show(db: DB, part_key: str | None = None):
             et.add_column("unit_cost", justify="right", width=10)
             et.add_column("project", width=16)
             et.add_column("note")
-            for e in ev:
+            for ts_utc, event_type, qty, unit_cost, project, note in ev:
                 et.add_row(
-                    safe_str(e["ts_utc"]),
-                    safe_str(e["event_type"]),
-                    safe_str(e["qty"]),
-                    fmt_money(e["unit_cost"]),
-                    shorten(safe_str(e["project"]), 16),
-                    shorten(safe_str(e["note"]), 60),
+                    "" if ts_utc is None else str(ts_utc),
+                    "" if event_type is None else str(event_type),
+                    "" if qty is None else str(qty),
+                    fmt_money(unit_cost),
+                    shorten(project, 16),
+                    shorten(note, 60),
                 )
             console.print(et)
     except Exception:
@@ -1471,6 +2017,102 @@ def pick_part_keys_from_browser(db: DB, title: str) -> list[str]:
         return []
     return _fetch_selected_part_keys(db, sel)
 
+# ----------------------------
+# Stock write statements (fixed text: the shared connection's statement cache reuses them)
+# ----------------------------
+_SQL_EVENT_INSERT = """
+    INSERT INTO inventory_events (event_uid, ts_utc, event_type, part_key, qty, unit_cost, total_cost, project, note)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_REMOVE_INSERT = """
+    INSERT INTO parts_removed (removal_uid, part_key, qty_removed, ts_utc, project, note, updated_utc)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# One UPSERT per received part: the row is inserted (new part) or accumulated (existing part)
+# in the same statement, so a part created or deleted between inv_receive's existence check
+# and this write (e.g. by an ingest) can't fail the INSERT or drop the qty on an UPDATE.
+_SQL_RECEIVE_UPSERT = """
+    INSERT INTO parts_received (
+        part_key, vendor, sku, description, desc_clean,
+        label_line1, label_line2, label_short,
+        purchase_url, airtable_url, label_qr_url, label_qr_text,
+        units_received, total_spend, last_invoice, avg_unit_cost, updated_utc
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(part_key) DO UPDATE SET
+      units_received = COALESCE(units_received, 0) + excluded.units_received,
+      total_spend = COALESCE(total_spend, 0) + excluded.total_spend,
+      avg_unit_cost =
+        CASE
+          WHEN (COALESCE(units_received, 0) + excluded.units_received) > 0
+           AND (COALESCE(total_spend, 0) + excluded.total_spend) > 0
+          THEN (COALESCE(total_spend, 0) + excluded.total_spend) / (COALESCE(units_received, 0) + excluded.units_received)
+          ELSE avg_unit_cost
+        END,
+      updated_utc = excluded.updated_utc
+"""
+
+_SQL_EDIT_LABELS_UPDATE = """
+    UPDATE parts_received
+    SET
+      label_line1 = ?,
+      label_line2 = ?,
+      label_short = ?,
+      purchase_url = ?,
+      airtable_url = ?,
+      label_qr_url = ?,
+      label_qr_text = ?,
+      updated_utc = ?
+    WHERE part_key = ?
+"""
+
+# Selections at least this big are matched through a temp-table join instead of IN (?, ?, ...):
+# the SQL text stays fixed (so it stays in the statement cache) and clear of SQLite's bound-parameter cap
+PART_KEYS_TEMP_MIN = 200
+
+@lru_cache(maxsize=None)
+def _in_placeholders(column: str, n: int) -> str:
+    return f"{column} IN ({','.join(['?'] * n)})"
+
+def part_keys_filter(db: DB, part_keys: list[str], column: str = "part_key") -> tuple[str, list[str]]:
+    """(WHERE fragment, params) matching `column` against part_keys; big lists go via temp.sel_part_keys."""
+    if not part_keys:
+        return "0", []
+    if len(part_keys) < PART_KEYS_TEMP_MIN:
+        # Pad to a power-of-two slot count (repeating a key is harmless in IN) so only a handful
+        # of distinct statements exist and each one stays prepared in the statement cache
+        n = max(8, 1 << (len(part_keys) - 1).bit_length())
+        params = list(part_keys)
+        params += [params[-1]] * (n - len(params))
+        return _in_placeholders(column, n), params
+    with db.conn as con:  # commit right away so no transaction stays open on the shared connection
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS sel_part_keys (part_key TEXT PRIMARY KEY)")
+        con.execute("DELETE FROM temp.sel_part_keys")
+        con.executemany(
+            "INSERT OR IGNORE INTO temp.sel_part_keys (part_key) VALUES (?)",
+            ((k,) for k in part_keys),
+        )
+    return f"{column} IN (SELECT part_key FROM temp.sel_part_keys)", []
+
+def existing_part_keys(db: DB, part_keys: list[str]) -> set[str]:
+    """Which of `part_keys` exist in parts_received (one query instead of one per key)."""
+    if not part_keys:
+        return set()
+    where, params = part_keys_filter(db, part_keys)
+    return {r[0] for r in db.rows(f"SELECT part_key FROM parts_received WHERE {where}", params)}
+
+def run_writes(db: DB, batches: list[tuple[str, list[list]]]) -> None:
+    """Apply (sql, params rows) batches in ONE transaction, each through a single executemany:
+    one commit for a whole multi-part action."""
+    batches = [(sql, rows) for sql, rows in batches if rows]
+    if not batches:
+        return
+    with db.conn as con:  # commits, or rolls everything back on error
+        for sql, rows in batches:
+            con.executemany(sql, rows)
+
 def inv_remove(db: DB):
     console.clear()
     header()
@@ -1500,29 +2142,20 @@ def inv_remove(db: DB):
     ensure_inventory_events_table(db)
 
     skipped = 0
+    existing = existing_part_keys(db, part_keys)
+    removals: list[list] = []
+    events: list[list] = []
     for part_key in part_keys:
-        exists = db.scalar("SELECT 1 FROM parts_received WHERE part_key = ? LIMIT 1", [part_key])
-        if not exists:
+        if part_key not in existing:
             skipped += 1
             continue
 
         removal_uid = str(uuid4())
-        db.execute(
-            """
-            INSERT INTO parts_removed (removal_uid, part_key, qty_removed, ts_utc, project, note, updated_utc)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [removal_uid, part_key, qty, ts, project, note, ts],
-        )
+        removals.append([removal_uid, part_key, qty, ts, project, note, ts])
 
         # Unified event log (qty negative for remove)
-        db.execute(
-            """
-            INSERT INTO inventory_events (event_uid, ts_utc, event_type, part_key, qty, unit_cost, total_cost, project, note)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [str(uuid4()), ts, "remove", part_key, -qty, None, None, project, note],
-        )
+        events.append([str(uuid4()), ts, "remove", part_key, -qty, None, None, project, note])
+    run_writes(db, [(_SQL_REMOVE_INSERT, removals), (_SQL_EVENT_INSERT, events)])
 
     if skipped:
         console.print(f"[yellow]Skipped {skipped} item(s) not found in parts_received.[/yellow]")
@@ -1561,39 +2194,14 @@ def inv_receive(db: DB):
     project = Prompt.ask("Project (optional)", default="").strip()
     note = Prompt.ask("Note (why?) (optional)", default="").strip()
 
-    added_spend_each = qty * unit_cost_f
-    ts = utc_now_iso()
-    ensure_inventory_events_table(db)
-
+    # Prompts happen while collecting; all writes then commit together (no transaction held open
+    # while waiting on the user)
+    existing = existing_part_keys(db, part_keys)
+    to_receive: list[str] = []
+    new_parts: dict[str, dict[str, str]] = {}
     for part_key in part_keys:
-        exists = db.scalar("SELECT 1 FROM parts_received WHERE part_key = ? LIMIT 1", [part_key])
-
-        if exists:
-            db.execute(
-                """
-                UPDATE parts_received
-                SET
-                  units_received = COALESCE(units_received, 0) + ?,
-                  total_spend = COALESCE(total_spend, 0) + ?,
-                  avg_unit_cost =
-                    CASE
-                      WHEN (COALESCE(units_received, 0) + ?) > 0 AND (COALESCE(total_spend, 0) + ?) > 0
-                      THEN (COALESCE(total_spend, 0) + ?) / (COALESCE(units_received, 0) + ?)
-                      ELSE avg_unit_cost
-                    END,
-                  updated_utc = ?
-                WHERE part_key = ?
-                """,
-                [qty, added_spend_each, qty, added_spend_each, added_spend_each, qty, ts, part_key],
-            )
-
-            db.execute(
-                """
-                INSERT INTO inventory_events (event_uid, ts_utc, event_type, part_key, qty, unit_cost, total_cost, project, note)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [str(uuid4()), ts, "receive", part_key, qty, unit_cost_f or None, added_spend_each or None, project, note],
-            )
+        if part_key in existing:
+            to_receive.append(part_key)
             continue
 
         if use_browser:
@@ -1606,45 +2214,62 @@ def inv_receive(db: DB):
         description = Prompt.ask("description", default="")
         label_short = Prompt.ask("label_short", default=description or part_key)
 
-        label_line1 = Prompt.ask("label_line1 (optional)", default="")
-        label_line2 = Prompt.ask("label_line2 (optional)", default="")
-        purchase_url = Prompt.ask("purchase_url (optional)", default="")
-        airtable_url = Prompt.ask("airtable_url (optional)", default="")
-        label_qr_url = Prompt.ask("label_qr_url (optional)", default="")
-        label_qr_text = Prompt.ask("label_qr_text (optional)", default="")
-
-        desc_clean = description.strip()
-        avg_unit_cost = (added_spend_each / qty) if (qty > 0 and added_spend_each > 0) else 0.0
-
-        db.execute(
-            """
-            INSERT INTO parts_received (
-                part_key, vendor, sku, description, desc_clean,
-                label_line1, label_line2, label_short,
-                purchase_url, airtable_url, label_qr_url, label_qr_text,
-                units_received, total_spend, last_invoice, avg_unit_cost, updated_utc
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                part_key, vendor, sku, description, desc_clean,
-                label_line1, label_line2, label_short,
-                purchase_url, airtable_url, label_qr_url, label_qr_text,
-                qty, added_spend_each, None, avg_unit_cost, ts,
-            ],
-        )
-
-        db.execute(
-            """
-            INSERT INTO inventory_events (event_uid, ts_utc, event_type, part_key, qty, unit_cost, total_cost, project, note)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [str(uuid4()), ts, "receive", part_key, qty, unit_cost_f or None, added_spend_each or None, project, note],
-        )
-
+        new_parts[part_key] = {
+            "vendor": vendor,
+            "sku": sku,
+            "description": description,
+            "label_short": label_short,
+            "label_line1": Prompt.ask("label_line1 (optional)", default=""),
+            "label_line2": Prompt.ask("label_line2 (optional)", default=""),
+            "purchase_url": Prompt.ask("purchase_url (optional)", default=""),
+            "airtable_url": Prompt.ask("airtable_url (optional)", default=""),
+            "label_qr_url": Prompt.ask("label_qr_url (optional)", default=""),
+            "label_qr_text": Prompt.ask("label_qr_text (optional)", default=""),
+        }
+        to_receive.append(part_key)
+
+    record_receipts(db, to_receive, qty, unit_cost_f, project, note, new_parts=new_parts)
     console.print("[green]Receive complete.[/green]")
     pause()
 
+def record_receipts(
+    db: DB,
+    part_keys: list[str],
+    qty: float,
+    unit_cost: float = 0.0,
+    project: str = "",
+    note: str = "",
+    new_parts: Optional[dict[str, dict[str, str]]] = None,
+) -> None:
+    """Receive `qty` of each part in one transaction (one UPSERT per part, one commit).
+    Keys in `new_parts` (part_key -> metadata) are new to parts_received; existing rows keep
+    their metadata and just accumulate. A single part is just a one-element list."""
+    new_parts = new_parts or {}
+    added_spend_each = qty * unit_cost
+    avg_unit_cost = (added_spend_each / qty) if (qty > 0 and added_spend_each > 0) else 0.0
+    ts = utc_now_iso()
+    ensure_inventory_events_table(db)
+
+    upserts: list[list] = []
+    events: list[list] = []
+    for part_key in part_keys:
+        meta = new_parts.get(part_key)
+        if meta is None:
+            # Existing part: only used if the row vanished since the check (vendor:sku, as inv_receive defaults)
+            vendor, _, sku = part_key.partition(":")
+            meta = {"vendor": vendor if sku else "", "sku": sku}
+        description = meta.get("description", "")
+        upserts.append([
+            part_key, meta.get("vendor", ""), meta.get("sku", ""), description, description.strip(),
+            meta.get("label_line1", ""), meta.get("label_line2", ""), meta.get("label_short", ""),
+            meta.get("purchase_url", ""), meta.get("airtable_url", ""),
+            meta.get("label_qr_url", ""), meta.get("label_qr_text", ""),
+            qty, added_spend_each, None, avg_unit_cost, ts,
+        ])
+        events.append([str(uuid4()), ts, "receive", part_key, qty, unit_cost or None, added_spend_each or None, project, note])
+
+    run_writes(db, [(_SQL_RECEIVE_UPSERT, upserts), (_SQL_EVENT_INSERT, events)])
+
 def inv_edit_labels(db: DB):
     console.clear()
     header()
@@ -1676,19 +2301,10 @@ def inv_edit_labels(db: DB):
     label_qr_text = ask_keep("label_qr_text")
 
     ts = utc_now_iso()
-    db.execute("""
-        UPDATE parts_received
-        SET
-          label_line1 = ?,
-          label_line2 = ?,
-          label_short = ?,
-          purchase_url = ?,
-          airtable_url = ?,
-          label_qr_url = ?,
-          label_qr_text = ?,
-          updated_utc = ?
-        WHERE part_key = ?
-    """, [label_line1, label_line2, label_short, purchase_url, airtable_url, label_qr_url, label_qr_text, ts, part_key])
+    db.execute(
+        _SQL_EDIT_LABELS_UPDATE,
+        [label_line1, label_line2, label_short, purchase_url, airtable_url, label_qr_url, label_qr_text, ts, part_key],
+    )
 
     console.print("[green]Updated label fields.[/green]")
     pause()
@@ -1699,6 +2315,24 @@ def inv_edit_labels(db: DB):
 # ----------------------------
 
 
+def table_row_counts(db: DB, names: list[str]) -> dict[str, str]:
+    """Row counts for several tables in one UNION ALL query ("?" where a table can't be counted)."""
+    if not names:
+        return {}
+    sql = " UNION ALL ".join(f'SELECT ?, COUNT(*) FROM "{name}"' for name in names)
+    try:
+        return {name: str(n or 0) for name, n in db.rows(sql, names)}
+    except Exception:
+        pass
+    # One bad table fails the whole statement: count individually so the rest still show
+    counts: dict[str, str] = {}
+    for name in names:
+        try:
+            counts[name] = str(db.scalar(f'SELECT COUNT(*) FROM "{name}"') or 0)
+        except Exception:
+            counts[name] = "?"
+    return counts
+
 def menu_db_diagnostics():
     db_path = default_db_path()
 
@@ -1712,10 +2346,10 @@ def menu_db_diagnostics():
     # If the DB doesn't exist yet, offer to create it.
     if not db_path.exists():
         _show_header()
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Create empty database (init schema)")
-        menu.add_row("0.", "Back")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "Create empty database (init schema)"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "0"], default="0")
         if choice == "1":
@@ -1723,6 +2357,8 @@ def menu_db_diagnostics():
             if ok:
                 from studio_inventory.main import init_inventory_db
                 init_inventory_db(db_path)
+                clear_schema_cache()
+                _fts_ready.clear()
                 db = get_db()
                 ensure_inventory_events_table(db)
                 console.print("[green]Database created.[/green]")
@@ -1747,25 +2383,21 @@ def menu_db_diagnostics():
         t.add_column("name")
         t.add_column("rows", justify="right", width=8)
 
+        counts = table_row_counts(db, [row["name"] for row in tables if row["type"] == "table"])
         for row in tables:
             name = row["name"]
             typ = row["type"]
-            count = ""
-            if typ == "table":
-                try:
-                    count = str(db.scalar(f'SELECT COUNT(*) FROM "{name}"') or 0)
-                except Exception:
-                    count = "?"
+            count = counts.get(name, "?") if typ == "table" else ""
             t.add_row(typ, name, count)
 
         console.print(t)
 
         console.print("\n")
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Reset database contents (truncate tables; keep schema)")
-        menu.add_row("2.", "Hard reset database file (delete DB; recreate schema)")
-        menu.add_row("0.", "Back")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "Reset database contents (truncate tables; keep schema)"),
+            ("2.", "Hard reset database file (delete DB; recreate schema)"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "2", "0"], default="0")
         if choice == "0":
@@ -1786,6 +2418,7 @@ def menu_db_diagnostics():
 
             try:
                 _reset_database_contents(db)
+                _fts_ready.pop(db.path, None)
                 ensure_inventory_events_table(db)
                 console.print("[green]Database cleared.[/green]")
             except Exception as e:
@@ -1807,7 +2440,8 @@ def menu_db_diagnostics():
                 continue
 
             try:
-                # Close any open connections by dropping the DB wrapper and deleting files.
+                # Close the cached connections before deleting files.
+                close_dbs()
                 db = None  # type: ignore
 
                 # Remove main DB and sidecar WAL/SHM files (best effort).
@@ -1820,6 +2454,8 @@ def menu_db_diagnostics():
 
                 from studio_inventory.main import init_inventory_db
                 init_inventory_db(db_path)
+                clear_schema_cache()
+                _fts_ready.clear()
 
                 db = get_db()
                 ensure_inventory_events_table(db)
@@ -1852,8 +2488,9 @@ def _reset_database_contents(db: DB) -> None:
                 """
             ).fetchall()
 
-            # deterministic order helps with debugging
-            names = sorted([r[0] for r in tables])
+            # deterministic order helps with debugging.
+            # FTS tables (and their shadow tables) are emptied by the parts_received triggers.
+            names = sorted([r[0] for r in tables if not r[0].startswith(INVENTORY_FTS)])
             for name in names:
                 con.execute(f'DELETE FROM "{name}";')
 
@@ -1928,6 +2565,9 @@ def list_label_templates() -> list[Path]:
     return sorted(d.glob("*.json"))
 
 def pick_label_template() -> Path | None:
+    # reportlab is the slowest import in the CLI; load it only when labels are used
+    from studio_inventory.labels.make_pdf import load_template
+
     templates = list_label_templates()
     if not templates:
         console.print("[red]No templates found in label_templates/*.json[/red]")
@@ -1942,7 +2582,7 @@ def pick_label_template() -> Path | None:
 
     for i, p in enumerate(templates, 1):
         try:
-            tpl = LabelTemplate.from_json(p)
+            tpl = load_template(p)
             size = f'{tpl.label_w/72:.2f}"×{tpl.label_h/72:.2f}"'
             grid = f"{tpl.cols}×{tpl.rows}"
             name = tpl.name
@@ -1971,7 +2611,9 @@ def _combine_where(base_where: str, dyn_where: str) -> str:
     return " WHERE " + dyn_where.strip() + " "
 
 def _fetch_selected_part_keys(db: DB, sel: dict) -> list[str]:
-    row_nums: list[int] = sel.get("row_nums", []) or []
+    # Only 1-based numbers can match; an all-invalid selection (e.g. "sel 0") skips the query,
+    # and a negative max would otherwise turn LIMIT into "no limit"
+    row_nums: list[int] = [n for n in (sel.get("row_nums", []) or []) if n >= 1]
     if not row_nums:
         return []
     base_where = sel.get("base_where", "") or ""
@@ -1992,28 +2634,50 @@ def _fetch_selected_part_keys(db: DB, sel: dict) -> list[str]:
 
     part_keys: list[str] = []
     for n in row_nums:
-        if 1 <= n <= len(key_rows):
+        if n <= len(key_rows):
             part_keys.append(key_rows[n - 1]["part_key"])
     return part_keys
 
-def _fetch_label_rows(db: DB, part_keys: list[str]) -> list[dict]:
-    if not part_keys:
+def _fetch_selected_label_rows(db: DB, sel: dict) -> list[dict]:
+    """Label fields for the browser rows picked in `sel`, in the order they were picked.
+    One statement: numbers the (filtered, sorted) view rows and keeps the picked ones."""
+    row_nums: list[int] = [n for n in (sel.get("row_nums", []) or []) if n >= 1]
+    if not row_nums:
         return []
-    qmarks = ",".join(["?"] * len(part_keys))
-    got = db.rows(f"""
-        SELECT
-            part_key, vendor, sku,
-            label_line1, label_line2, label_short,
-            purchase_url, label_qr_text
-        FROM parts_received
-        WHERE part_key IN ({qmarks})
-    """, part_keys)
-    by_key = {r["part_key"]: dict(r) for r in got}
-    return [by_key[k] for k in part_keys if k in by_key]
+    where = _combine_where(sel.get("base_where", "") or "", sel.get("dyn_where", "") or "")
+    order_by = sel.get("order_by", "vendor, sku") or "vendor, sku"
+    params = list(sel.get("base_params", []) or []) + list(sel.get("dyn_params", []) or [])
+
+    # Build each dict straight from the cursor's tuples: no fetchall list, no sqlite3.Row per row
+    cur = db.conn.cursor()
+    cur.row_factory = None
+    try:
+        cur.execute(f"""
+            SELECT * FROM (
+                SELECT
+                    ROW_NUMBER() OVER (ORDER BY {order_by}) AS rn,
+                    part_key, vendor, sku,
+                    label_line1, label_line2, label_short,
+                    purchase_url, label_qr_text
+                FROM inventory_view
+                {where}
+                ORDER BY {order_by}
+                LIMIT ?
+            )
+            WHERE rn IN (SELECT value FROM json_each(?))
+        """, params + [max(row_nums), json.dumps(row_nums)])
+        cols = [d[0] for d in cur.description][1:]
+        by_rn = {r[0]: dict(zip(cols, r[1:])) for r in cur}
+    finally:
+        cur.close()
+    # Kept as a list: the layout loop re-renders the same rows for every preview/export
+    return [by_rn[n] for n in row_nums if n in by_rn]
 
 def _default_layout_for_template(tpl_path: Path) -> dict:
+    from studio_inventory.labels.make_pdf import load_template
+
     try:
-        t = LabelTemplate.from_json(tpl_path)
+        t = load_template(tpl_path)
         base_size = int(t.font_size)
     except Exception:
         base_size = 8
@@ -2225,7 +2889,49 @@ def _layout_summary(layout: dict) -> None:
         f"pad_rel={qr_cfg.get('pad_rel','')} size_rel={qr_cfg.get('size_rel','')}[/dim]"
     )
 
+# Rendered sheets kept in the label cache (oldest dropped first)
+LABEL_CACHE_KEEP = 20
+
+def make_labels_pdf_cached(*, out_pdf: Path, template_path: Path, rows: list[dict], **opts) -> bool:
+    """make_labels_pdf, but a sheet rendered before with the same template file, rows, layout and
+    options (e.g. the preview, or a reprint after a misprint) is copied instead. True on a cache hit."""
+    import hashlib
+
+    from studio_inventory.labels import make_pdf
+
+    payload = json.dumps(
+        [
+            str(template_path),
+            template_path.stat().st_mtime_ns,
+            Path(make_pdf.__file__).stat().st_mtime_ns,  # renderer changes invalidate too
+            rows,
+            opts,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    cached = label_cache_dir() / f"labels_{key}.pdf"
+
+    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+    if cached.exists():
+        shutil.copyfile(cached, out_pdf)
+        cached.touch()  # most recently used
+        return True
+
+    make_pdf.make_labels_pdf(template_path=template_path, out_pdf=out_pdf, rows=rows, **opts)
+    try:
+        shutil.copyfile(out_pdf, cached)
+        old = sorted(label_cache_dir().glob("labels_*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for p in old[LABEL_CACHE_KEEP:]:
+            p.unlink(missing_ok=True)
+    except OSError:
+        pass  # the cache is best-effort; the requested PDF is already written
+    return False
+
 def labels_generate(db: DB):
+    from studio_inventory.labels.make_pdf import load_template
+
     console.clear()
     header()
     console.print("[bold]Labels → Generate PDF[/bold]\n")
@@ -2241,15 +2947,9 @@ def labels_generate(db: DB):
     if not sel:
         return
 
-    part_keys = _fetch_selected_part_keys(db, sel)
-    if not part_keys:
-        console.print("[yellow]No valid rows selected.[/yellow]")
-        pause()
-        return
-
-    rows = _fetch_label_rows(db, part_keys)
+    rows = _fetch_selected_label_rows(db, sel)
     if not rows:
-        console.print("[yellow]No label data found for selected items.[/yellow]")
+        console.print("[yellow]No valid rows selected.[/yellow]")
         pause()
         return
 
@@ -2258,7 +2958,7 @@ def labels_generate(db: DB):
 
     # template font size for defaults
     try:
-        tpl_obj = LabelTemplate.from_json(tpl_path)
+        tpl_obj = load_template(tpl_path)
         tpl_font_size = int(tpl_obj.font_size)
         per_sheet = int(tpl_obj.cols * tpl_obj.rows)
     except Exception:
@@ -2276,15 +2976,15 @@ def labels_generate(db: DB):
             console.print(f"[dim]Preset:[/dim] {loaded_name}")
         _layout_summary(layout)
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Edit elements")
-        menu.add_row("2.", "Edit QR")
-        menu.add_row("3.", "Set used labels on sheet")
-        menu.add_row("4.", "Preview (opens PDF)")
-        menu.add_row("5.", "Save preset")
-        menu.add_row("6.", "Export final PDF")
-        menu.add_row("0.", "Back")
-        console.print("\n", menu)
+        console.print("\n", menu_table(
+            ("1.", "Edit elements"),
+            ("2.", "Edit QR"),
+            ("3.", "Set used labels on sheet"),
+            ("4.", "Preview (opens PDF)"),
+            ("5.", "Save preset"),
+            ("6.", "Export final PDF"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("Choose", choices=["1","2","3","4","5","6","0"], default="4")
         if choice == "0":
@@ -2307,7 +3007,7 @@ def labels_generate(db: DB):
             pause()
         elif choice == "4":
             preview_path = exports_dir() / "_labels_preview.pdf"
-            make_labels_pdf(
+            make_labels_pdf_cached(
                 template_path=tpl_path,
                 out_pdf=preview_path,
                 rows=rows,
@@ -2324,7 +3024,7 @@ def labels_generate(db: DB):
             if not name.lower().endswith(".pdf"):
                 name += ".pdf"
             out_pdf = exports_dir() / name
-            make_labels_pdf(
+            make_labels_pdf_cached(
                 template_path=tpl_path,
                 out_pdf=out_pdf,
                 rows=rows,
@@ -2339,15 +3039,16 @@ def labels_generate(db: DB):
 
 def menu_labels():
     db = get_db()
+    ensure_inventory_view(db)
     while True:
         console.clear()
         header()
         console.print("[bold]Labels[/bold]\n")
 
-        menu = Table(show_header=False, box=None)
-        menu.add_row("1.", "Generate labels PDF (with preview)")
-        menu.add_row("0.", "Back")
-        console.print(menu)
+        console.print(menu_table(
+            ("1.", "Generate labels PDF (with preview)"),
+            ("0.", "Back"),
+        ))
 
         choice = Prompt.ask("\nChoose", choices=["1", "0"], default="1")
         if choice == "0":
@@ -2414,6 +3115,11 @@ def export(
         "--list",
         help="List SQLite tables/views, then exit.",
     ),
+    gzip_out: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Write gzip-compressed CSV (adds .gz to the output path).",
+    ),
     db_path: Optional[Path] = typer.Option(
         None,
         "--db",
@@ -2434,6 +3140,12 @@ def export(
             ORDER BY type, name
             """
         )
+        if not console.is_terminal:
+            # Piped/redirected: plain "type<TAB>name" lines for grep/cut, no box drawing or layout pass
+            csv.writer(sys.stdout, delimiter="\t", lineterminator="\n").writerows(
+                (r["type"], r["name"]) for r in objs
+            )
+            return
         t = Table(title="SQLite objects")
         t.add_column("Type", style="dim")
         t.add_column("Name")
@@ -2452,7 +3164,7 @@ def export(
         else exports_dir() / f"{object_name}_{timestamp_slug()}.csv"
     )
 
-    export_sqlite_object_to_csv(db, object_name, out_path)
+    export_sqlite_object_to_csv(db, object_name, out_path, compress=gzip_out)
 
 @app.command()
 def init():
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import os
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Any
+from typing import Iterable, Iterator, Optional, Any
 
 
 # ----------------------------
@@ -14,12 +16,78 @@ from typing import Iterable, Optional, Any
 from studio_inventory.paths import db_path
 
 def default_db_path() -> Path:
+    # Keyed on STUDIO_INV_HOME so `ingest --workspace` (which sets it at runtime) still resolves fresh
+    return _default_db_path(os.getenv("STUDIO_INV_HOME"))
+
+@lru_cache(maxsize=None)
+def _default_db_path(_inv_home: Optional[str]) -> Path:
     p = db_path()
     p.parent.mkdir(parents=True, exist_ok=True)
     return p
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Same text as datetime.now(timezone.utc).replace(microsecond=0).isoformat(), ~2.5x cheaper
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+# ----------------------------
+# Shared schema
+# ----------------------------
+# Computed inventory (received - removed). Removals are summed per row through
+# idx_parts_removed_part_key instead of aggregating all of parts_removed up front, so
+# LIMITed / single-part reads only touch the parts they return.
+INVENTORY_VIEW_SQL = """
+    CREATE VIEW inventory_view AS
+    SELECT
+        pr.part_key,
+        pr.vendor,
+        pr.sku,
+        pr.description,
+        pr.desc_clean,
+        pr.label_line1,
+        pr.label_line2,
+        pr.label_short,
+        pr.purchase_url,
+        pr.airtable_url,
+        pr.label_qr_url,
+        pr.label_qr_text,
+        pr.units_received,
+        pr.units_removed,
+        (pr.units_received - pr.units_removed) AS on_hand,
+        pr.avg_unit_cost,
+        pr.total_spend,
+        pr.last_invoice
+    FROM (
+        SELECT
+            p.part_key, p.vendor, p.sku, p.description, p.desc_clean,
+            p.label_line1, p.label_line2, p.label_short,
+            p.purchase_url, p.airtable_url, p.label_qr_url, p.label_qr_text,
+            p.units_received, p.avg_unit_cost, p.total_spend, p.last_invoice,
+            COALESCE(
+                (SELECT SUM(rm.qty_removed) FROM parts_removed rm WHERE rm.part_key = p.part_key), 0
+            ) AS units_removed
+        FROM parts_received p
+    ) pr
+"""
+
+
+# Indexes behind the inventory browser's sort keys, so a page reads the first rows of an index
+# instead of sorting the view: "v" (vendor, sku), "c" (avg_unit_cost DESC, vendor, sku) and
+# "o" (last_invoice DESC), the last two with the part_key tie-breaker
+PARTS_RECEIVED_INDEXES_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_parts_received_vendor_sku ON parts_received(vendor, sku);",
+    """
+    CREATE INDEX IF NOT EXISTS idx_parts_received_cost
+    ON parts_received(avg_unit_cost DESC, vendor, sku, part_key);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_parts_received_invoice_key
+    ON parts_received(last_invoice DESC, part_key);
+    """,
+)
+
+# inv_show's "recent events" (WHERE part_key = ? ORDER BY ts_utc DESC LIMIT 10) seeks instead of scanning the log
+INVENTORY_EVENTS_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_inventory_events_part_ts ON inventory_events(part_key, ts_utc);"
 
 
 # ----------------------------
@@ -28,29 +96,86 @@ def utc_now_iso() -> str:
 @dataclass
 class DB:
     path: Path
+    _con: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
-    def connect(self) -> sqlite3.Connection:
-        con = sqlite3.connect(self.path)
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Long-lived connection shared by scalar/rows/execute (opened on first use)."""
+        if self._con is None:
+            self._con = self.connect()
+        return self._con
+
+    def close(self) -> None:
+        if self._con is not None:
+            try:
+                self._con.close()
+            finally:
+                self._con = None
+
+    def connect(self, tuned: bool = True) -> sqlite3.Connection:
+        """Open a connection. `tuned=False` skips the PRAGMAs below (plain sqlite3 defaults)."""
+        # timeout= is sqlite's busy_timeout: wait up to 5 s on a lock held by an ingest writer
+        # cached_statements: the long-lived connection keeps the app's fixed SQL prepared (default 128)
+        con = sqlite3.connect(self.path, timeout=5.0, cached_statements=256)
         con.row_factory = sqlite3.Row
+        if not tuned:
+            return con
+        try:
+            # WAL lets readers run alongside a writer (journal_mode persists in the file)
+            mode = con.execute("PRAGMA journal_mode=WAL;").fetchone()[0]
+        except sqlite3.OperationalError:
+            mode = None  # e.g. locked while another connection switches modes; keep the current mode
+        if mode == "wal":
+            con.execute("PRAGMA synchronous=NORMAL;")  # WAL stays consistent; fsync only at checkpoints
+        con.execute("PRAGMA mmap_size=268435456;")  # 256 MB memory-mapped reads
+        con.execute("PRAGMA cache_size=-65536;")    # 64 MB page cache
+        con.execute("PRAGMA temp_store=MEMORY;")    # sorts / temp b-trees stay in RAM
+        con.execute("PRAGMA foreign_keys=ON;")      # as the ingest writers already do
         return con
 
+    @contextmanager
+    def read_transaction(self) -> Iterator[sqlite3.Connection]:
+        """One connection in one deferred read transaction: a consistent snapshot whose page cache
+        stays warm across several queries (e.g. exporting many tables)."""
+        con = self.connect()
+        try:
+            con.execute("BEGIN")
+            yield con
+        finally:
+            con.rollback()  # read-only; nothing to commit
+            con.close()
+
     def scalar(self, sql: str, params: Optional[Iterable[Any]] = None) -> Any:
-        with self.connect() as con:
-            cur = con.execute(sql, list(params or []))
+        cur = self.conn.execute(sql, list(params or []))
+        try:
             row = cur.fetchone()
-            return None if row is None else row[0]
+        finally:
+            cur.close()  # reset the statement so it doesn't pin a read snapshot on the shared connection
+        return None if row is None else row[0]
 
     def rows(self, sql: str, params: Optional[Iterable[Any]] = None) -> list[sqlite3.Row]:
-        with self.connect() as con:
-            cur = con.execute(sql, list(params or []))
-            return cur.fetchall()
+        return self.conn.execute(sql, list(params or [])).fetchall()
+
+    def iter_rows(self, sql: str, params: Optional[Iterable[Any]] = None) -> Iterator[sqlite3.Row]:
+        """Yield rows straight off the cursor (nothing is materialized); the connection closes when exhausted."""
+        con = self.connect()
+        try:
+            yield from con.execute(sql, list(params or []))
+        finally:
+            con.close()
 
     def execute(self, sql: str, params: Optional[Iterable[Any]] = None) -> int:
-        with self.connect() as con:
+        with self.conn as con:  # commits, or rolls back on error
             cur = con.execute(sql, list(params or []))
-            con.commit()
+            return cur.rowcount
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> int:
+        """Run one statement for every params row in a single transaction (one commit, not one per row).
+        Single-row callers can pass a one-element list."""
+        with self.conn as con:
+            cur = con.executemany(sql, seq_of_params)
             return cur.rowcount
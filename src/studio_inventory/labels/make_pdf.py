@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import itertools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -9,9 +13,7 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 
-from reportlab.graphics.barcode import qr
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics import renderPDF
+from reportlab.graphics.barcode import qrencoder
 
 
 @dataclass
@@ -54,6 +56,17 @@ class LabelTemplate:
         )
 
 
+def load_template(path: Path) -> LabelTemplate:
+    """Parsed template for `path`, reused until the file changes (keyed on its mtime)."""
+    path = Path(path)
+    return _load_template(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _load_template(path: str, _mtime_ns: int) -> LabelTemplate:
+    return LabelTemplate.from_json(Path(path))
+
+
 def _label_xy(t: LabelTemplate, index0: int) -> tuple[float, float]:
     """
     index0: 0-based within a page, left-to-right then top-to-bottom.
@@ -68,21 +81,96 @@ def _label_xy(t: LabelTemplate, index0: int) -> tuple[float, float]:
     return x, y
 
 
-def _draw_qr(c: canvas.Canvas, x: float, y: float, size: float, text: str) -> None:
-    code = qr.QrCodeWidget(text)
-    bounds = code.getBounds()
-    w = bounds[2] - bounds[0]
-    h = bounds[3] - bounds[1]
-    d = Drawing(size, size, transform=[size / w, 0, 0, size / h, 0, 0])
-    d.add(code)
-    renderPDF.draw(d, c, x, y)
+# QR module matrices by payload text; encoding (Reed-Solomon + mask scoring) is the CPU-heavy part
+_QR_CACHE: dict[str, tuple[tuple[bool, ...], ...]] = {}
+_QR_CACHE_MAX = 4096
+
+# Distinct QR payloads needed before encoding is farmed out to worker processes
+# (below this, starting the workers costs more than it saves)
+QR_POOL_MIN = 128
+QR_POOL_WORKERS = 8
+
+
+@lru_cache(maxsize=1)
+def _segno():
+    # Optional: segno encodes ~1.7x faster than reportlab's pure-Python encoder
+    try:
+        import segno
+    except ImportError:
+        return None
+    return segno
+
+
+def _encode_qr(text: str) -> tuple[tuple[bool, ...], ...]:
+    """Dark/light module matrix for `text` (no quiet zone), error correction level L or better."""
+    segno = _segno()
+    if segno is not None:
+        return tuple(tuple(bool(m) for m in row) for row in segno.make_qr(text, error="l").matrix)
+
+    code = qrencoder.QRCode(None, qrencoder.QRErrorCorrectLevel.L)
+    code.addData(text)
+    code.make()
+    return tuple(tuple(bool(m) for m in row) for row in code.modules)
+
+
+def _qr_matrix(text: str) -> tuple[tuple[bool, ...], ...]:
+    m = _QR_CACHE.get(text)
+    if m is None:
+        if len(_QR_CACHE) >= _QR_CACHE_MAX:
+            _QR_CACHE.clear()
+        m = _QR_CACHE[text] = _encode_qr(text)
+    return m
+
+
+def _prefetch_qr(texts: Iterable[str]) -> None:
+    """Encode many distinct QR payloads across processes up front; anything left is encoded while drawing."""
+    todo = [s for s in dict.fromkeys(texts) if s and s not in _QR_CACHE]
+    workers = min(QR_POOL_WORKERS, os.cpu_count() or 1)
+    if len(todo) < QR_POOL_MIN or workers < 2:
+        return
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for s, m in zip(todo, ex.map(_encode_qr, todo, chunksize=16)):
+                _QR_CACHE[s] = m
+    except Exception:
+        pass  # e.g. no process support here; fall back to encoding in-process
+
+
+def _draw_qr(c: canvas.Canvas, x: float, y: float, size: float, text: str, border: int = 4) -> None:
+    # Same geometry as a QrCodeWidget scaled into a size x size box, drawn as one filled path
+    modules = _qr_matrix(text)
+    box = size / (len(modules) + border * 2.0)
+    p = c.beginPath()
+    for r, row in enumerate(modules):
+        col = 0
+        for dark, run in itertools.groupby(row):
+            n = len(list(run))
+            if dark:
+                p.rect(x + (col + border) * box, y + size - (r + border + 1) * box, n * box, box)
+            col += n
+    c.saveState()
+    c.setFillColorRGB(0, 0, 0)
+    c.drawPath(p, stroke=0, fill=1)
+    c.restoreState()
+
+
+def _qr_text(item: dict, include_qr: bool, layout: Optional[dict]) -> str:
+    """The QR payload make_labels_pdf will draw for `item` ("" if none)."""
+    if layout:
+        qr_cfg = layout.get("qr", {}) or {}
+        if not qr_cfg.get("enabled", False):
+            return ""
+        return _source_value(item, qr_cfg.get("source", "purchase_url")).strip()
+    if not include_qr:
+        return ""
+    return (item.get("label_qr_text") or item.get("purchase_url") or item.get("part_key") or "").strip()
 
 
 def make_labels_pdf(
     *,
     template_path: Path,
     out_pdf: Path,
-    rows: list[dict],
+    rows: Iterable[dict],
     start_pos: int = 1,
     include_qr: bool = False,
     layout: Optional[dict] = None,
@@ -90,12 +178,14 @@ def make_labels_pdf(
 ) -> None:
     """
     Generate label sheets.
-    - rows: list of dicts with keys like: vendor, sku, label_line1, label_short, purchase_url, label_qr_text, part_key
+    - rows: dicts with keys like: vendor, sku, label_line1, label_short, purchase_url, label_qr_text, part_key
+      (any iterable, read once in order, so a generator works; with QR on it is listed first so
+      that many distinct payloads can be encoded in parallel)
     - start_pos: 1-based label position on sheet; 1 = first label top-left.
     - layout: optional layout preset dict (elements + qr settings)
     - draw_boxes: if True, outlines each label (calibration/debug)
     """
-    t = LabelTemplate.from_json(template_path)
+    t = load_template(template_path)
     out_pdf.parent.mkdir(parents=True, exist_ok=True)
 
     c = canvas.Canvas(str(out_pdf), pagesize=(t.page_w, t.page_h))
@@ -103,6 +193,12 @@ def make_labels_pdf(
 
     per_page = t.cols * t.rows
     pos = max(1, int(start_pos)) - 1  # 0-based
+    # Every sheet has the same slots: work out each label origin once, then index by page position
+    slots = [_label_xy(t, i) for i in range(per_page)]
+
+    if include_qr or (layout and (layout.get("qr", {}) or {}).get("enabled", False)):
+        rows = list(rows)
+        _prefetch_qr(_qr_text(item, include_qr, layout) for item in rows)
 
     for item in rows:
         page_pos = pos % per_page
@@ -110,7 +206,7 @@ def make_labels_pdf(
             c.showPage()
             c.setFont(t.font_name, t.font_size)
 
-        x0, y0 = _label_xy(t, page_pos)
+        x0, y0 = slots[page_pos]
         if draw_boxes:
             c.rect(x0, y0, t.label_w, t.label_h, stroke=1, fill=0)
 
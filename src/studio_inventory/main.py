@@ -18,6 +18,10 @@ import sys
 from urllib.parse import quote_plus
 import pandas as pd
 
+from studio_inventory.db import (
+    INVENTORY_VIEW_SQL,
+    PARTS_RECEIVED_INDEXES_SQL,
+)
 from studio_inventory.vendors.registry import pick_parser
 from studio_inventory.paths import workspace_root, log_dir, receipts_dir, project_root, imports_run_dir
 
@@ -1129,6 +1133,9 @@ def init_inventory_db(dbfile: Path):
         conn.execute('CREATE INDEX IF NOT EXISTS idx_line_items_part_key ON line_items(part_key);')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_parts_removed_part_key ON parts_removed(part_key);')
         conn.execute('CREATE INDEX IF NOT EXISTS idx_orders_vendor ON orders(vendor);')
+        # inventory_view sort keys (lets ORDER BY ... LIMIT walk an index instead of sorting the view)
+        for stmt in PARTS_RECEIVED_INDEXES_SQL:
+            conn.execute(stmt)
 
         # Ensure label columns exist (supports schema upgrades without rebuilding the DB)
         _ensure_columns(conn, "line_items", ["desc_clean", "label_line1", "label_line2", "label_short", "purchase_url", "airtable_url", "label_qr_url", "label_qr_text"])
@@ -1136,35 +1143,7 @@ def init_inventory_db(dbfile: Path):
 
         # View: computed inventory (received - removed)
         conn.execute("DROP VIEW IF EXISTS inventory_view;")
-        conn.execute("""
-            CREATE VIEW inventory_view AS
-            SELECT
-                pr.part_key,
-                pr.vendor,
-                pr.sku,
-                pr.description,
-                pr.desc_clean,
-                pr.label_line1,
-                pr.label_line2,
-                pr.label_short,
-                pr.purchase_url,
-                pr.airtable_url,
-                pr.label_qr_url,
-                pr.label_qr_text,
-                pr.units_received,
-                COALESCE(r.removed, 0) AS units_removed,
-                (pr.units_received - COALESCE(r.removed, 0)) AS on_hand,
-                pr.avg_unit_cost,
-                pr.total_spend,
-                pr.last_invoice
-            FROM parts_received pr
-            LEFT JOIN (
-                SELECT part_key, SUM(qty_removed) AS removed
-                FROM parts_removed
-                GROUP BY part_key
-            ) r
-            ON pr.part_key = r.part_key;
-        """)
+        conn.execute(INVENTORY_VIEW_SQL)
 
         conn.commit()
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 import os
 from datetime import datetime, date
+from functools import lru_cache
 
 APP_NAME = "StudioInventory"
 
@@ -12,11 +13,22 @@ def workspace_root() -> Path:
     Defaults to ~/StudioInventory.
     Override with STUDIO_INV_HOME=/path.
     """
-    env = os.getenv("STUDIO_INV_HOME")
+    # Keyed on STUDIO_INV_HOME so `--workspace` (which sets it at runtime) still resolves fresh
+    return _workspace_root(os.getenv("STUDIO_INV_HOME"))
+
+@lru_cache(maxsize=None)
+def _workspace_root(env: str | None) -> Path:
     if env:
         return Path(env).expanduser().resolve()
     return (Path.home() / APP_NAME).resolve()
 
+@lru_cache(maxsize=None)
+def _workspace_subdir(root: Path, name: str) -> Path:
+    # mkdir once per (workspace, folder) rather than on every call
+    d = root / name
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
 def ensure_workspace() -> Path:
     """Create the workspace folder structure if missing; return workspace root."""
     root = workspace_root()
@@ -29,40 +41,30 @@ def db_path() -> Path:
     return workspace_root() / "studio_inventory.sqlite"
 
 def receipts_dir() -> Path:
-    d = workspace_root() / "receipts"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "receipts")
 
 def exports_dir() -> Path:
-    d = workspace_root() / "exports"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "exports")
 
 def log_dir() -> Path:
-    d = workspace_root() / "log"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "log")
 
 def label_presets_dir() -> Path:
-    d = workspace_root() / "label_presets"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "label_presets")
 
 def label_templates_dir() -> Path:
-    d = workspace_root() / "label_templates"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "label_templates")
+
+def label_cache_dir() -> Path:
+    """Rendered label PDFs keyed by content hash (safe to delete)."""
+    return _workspace_subdir(workspace_root(), "label_cache")
 
 def secrets_dir() -> Path:
-    d = workspace_root() / "secrets"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "secrets")
 
 def imports_dir() -> Path:
     """Workspace archive folder for original PDFs copied at ingest time."""
-    d = workspace_root() / "imports"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return _workspace_subdir(workspace_root(), "imports")
 
 def imports_run_dir(run_date: date | None = None) -> Path:
     """Date-stamped ingest folder inside imports/, e.g. imports/2026-01-30."""
@@ -71,6 +73,7 @@ def imports_run_dir(run_date: date | None = None) -> Path:
     d.mkdir(parents=True, exist_ok=True)
     return d
 
+@lru_cache(maxsize=1)
 def project_root() -> Path:
     """Best-effort repo root when running from source.
 
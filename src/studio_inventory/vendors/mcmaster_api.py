@@ -3,17 +3,15 @@ from __future__ import annotations
 import os
 import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pathlib import Path
 from dotenv import load_dotenv
-from requests_pkcs12 import post, put, get
-
-BASE = "https://api.mcmaster.com/v1"
+from requests import Session
+from requests_pkcs12 import Pkcs12Adapter
 
+from studio_inventory.db import utc_now_iso
 
-def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+BASE = "https://api.mcmaster.com/v1"
 
 
 @dataclass
@@ -40,17 +38,34 @@ class McMasterClient:
     def __init__(self, creds: McMasterCreds):
         self.creds = creds
         self._token: Optional[str] = None
+        self._session: Optional[Session] = None
+
+    @property
+    def session(self) -> Session:
+        # One session: the client certificate is loaded once and TLS connections are kept alive
+        # (module-level requests_pkcs12.get/put/post build a new session + SSL context per call)
+        if self._session is None:
+            s = Session()
+            s.mount(BASE, Pkcs12Adapter(
+                pkcs12_filename=self.creds.pfx_path,
+                pkcs12_password=self.creds.pfx_password,
+            ))
+            self._session = s
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     # -------- Auth --------
     def login(self) -> None:
-        r = post(
+        r = self.session.post(
             f"{BASE}/login",
             json={
                 "UserName": self.creds.username,
                 "Password": self.creds.password,
             },
-            pkcs12_filename=self.creds.pfx_path,
-            pkcs12_password=self.creds.pfx_password,
             timeout=30,
         )
         r.raise_for_status()
@@ -64,12 +79,10 @@ class McMasterClient:
     # -------- API calls --------
     def add_product(self, part_number: str) -> None:
         # Required subscription step
-        r = put(
+        r = self.session.put(
             f"{BASE}/products",
             headers=self.headers(),
             json={"PartNumber": part_number},
-            pkcs12_filename=self.creds.pfx_path,
-            pkcs12_password=self.creds.pfx_password,
             timeout=30,
         )
         # 409 = already subscribed (fine)
@@ -77,11 +90,9 @@ class McMasterClient:
             r.raise_for_status()
 
     def product_info(self, part_number: str) -> Dict[str, Any]:
-        r = get(
+        r = self.session.get(
             f"{BASE}/products/{part_number}",
             headers=self.headers(),
-            pkcs12_filename=self.creds.pfx_path,
-            pkcs12_password=self.creds.pfx_password,
             timeout=30,
         )
         r.raise_for_status()
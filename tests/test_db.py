@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+
+from studio_inventory import db
+
+
+def test_utc_now_iso_matches_isoformat():
+    # The original stamp: whole seconds, "+00:00" suffix
+    before = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    stamp = db.utc_now_iso()
+    after = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    assert stamp in (before, after)
+    assert stamp.endswith("+00:00")
+    assert datetime.fromisoformat(stamp).tzinfo == timezone.utc
+
+
+def test_utc_now_iso_matches_isoformat_at_fixed_times(monkeypatch):
+    real_gmtime = db.time.gmtime
+    for ts in (0, 951782400, 1700000000, 1772323199, 4102444800):
+        monkeypatch.setattr(db.time, "gmtime", lambda *_: real_gmtime(ts))
+        assert db.utc_now_iso() == datetime.fromtimestamp(ts, timezone.utc).isoformat(), ts
@@ -0,0 +1,224 @@
+import csv
+import gzip
+import sqlite3
+from uuid import uuid4
+
+import pytest
+
+from studio_inventory import cli
+from studio_inventory.db import DB
+from studio_inventory.main import init_inventory_db
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setenv("STUDIO_INV_HOME", str(tmp_path))
+    path = tmp_path / "studio_inventory.sqlite"
+    init_inventory_db(path)
+    d = DB(path)
+    yield d
+    d.close()
+
+
+def add_part(db: DB, part_key: str, **cols) -> None:
+    vendor, _, sku = part_key.partition(":")
+    row = {"part_key": part_key, "vendor": vendor, "sku": sku, "units_received": 1, **cols}
+    names = ", ".join(row)
+    db.execute(f"INSERT INTO parts_received ({names}) VALUES ({', '.join('?' for _ in row)})", list(row.values()))
+
+
+def remove(db: DB, part_key: str, qty: float) -> None:
+    # What inv_remove writes, after its prompts
+    ts = cli.utc_now_iso()
+    cli.ensure_inventory_events_table(db)
+    cli.run_writes(db, [
+        (cli._SQL_REMOVE_INSERT, [[str(uuid4()), part_key, qty, ts, "proj", "note", ts]]),
+        (cli._SQL_EVENT_INSERT, [[str(uuid4()), ts, "remove", part_key, -qty, None, None, "proj", "note"]]),
+    ])
+
+
+def on_hand(db: DB, part_key: str):
+    return db.scalar("SELECT on_hand FROM inventory_view WHERE part_key = ?", [part_key])
+
+
+# ----------------------------
+# Receive / remove
+# ----------------------------
+def test_receive_new_and_existing_parts(db):
+    add_part(db, "mcmaster:91290A115", units_received=2, total_spend=3.0, avg_unit_cost=1.5)
+    new = {"vendor": "digikey", "sku": "X1", "description": " Resistor ", "label_short": "R"}
+
+    cli.record_receipts(db, ["mcmaster:91290A115", "digikey:X1"], 4, 2.5, "proj", "restock", new_parts={"digikey:X1": new})
+
+    old = db.rows("SELECT * FROM parts_received WHERE part_key = 'mcmaster:91290A115'")[0]
+    assert old["units_received"] == 6
+    assert old["total_spend"] == 13.0
+    added = db.rows("SELECT * FROM parts_received WHERE part_key = 'digikey:X1'")[0]
+    assert (added["vendor"], added["sku"], added["desc_clean"], added["label_short"]) == ("digikey", "X1", "Resistor", "R")
+    assert added["units_received"] == 4
+    assert added["avg_unit_cost"] == 2.5
+
+    events = db.rows("SELECT event_type, part_key, qty, unit_cost, total_cost FROM inventory_events ORDER BY part_key")
+    assert [tuple(e) for e in events] == [
+        ("receive", "digikey:X1", 4, 2.5, 10.0),
+        ("receive", "mcmaster:91290A115", 4, 2.5, 10.0),
+    ]
+
+
+def test_remove_lowers_on_hand_and_logs_event(db):
+    add_part(db, "mcmaster:91290A115", units_received=5)
+    remove(db, "mcmaster:91290A115", 2)
+    remove(db, "mcmaster:91290A115", 0.5)
+
+    assert on_hand(db, "mcmaster:91290A115") == 2.5
+    assert db.scalar("SELECT SUM(qty) FROM inventory_events WHERE event_type = 'remove'") == -2.5
+
+
+def test_run_writes_is_one_transaction(db):
+    add_part(db, "mcmaster:91290A115", units_received=5)
+    cli.ensure_inventory_events_table(db)
+    ts = cli.utc_now_iso()
+    dup = str(uuid4())
+    with pytest.raises(sqlite3.IntegrityError):
+        cli.run_writes(db, [
+            (cli._SQL_REMOVE_INSERT, [[str(uuid4()), "mcmaster:91290A115", 1, ts, "", "", ts]]),
+            # the second event reuses the first one's uid: the whole action must roll back
+            (cli._SQL_EVENT_INSERT, [
+                [dup, ts, "remove", "mcmaster:91290A115", -1, None, None, "", ""],
+                [dup, ts, "remove", "mcmaster:91290A115", -1, None, None, "", ""],
+            ]),
+        ])
+
+    assert db.scalar("SELECT COUNT(*) FROM parts_removed") == 0
+    assert db.scalar("SELECT COUNT(*) FROM inventory_events") == 0
+    assert on_hand(db, "mcmaster:91290A115") == 5
+
+
+# ----------------------------
+# Keyset paging
+# ----------------------------
+def add_paging_parts(db: DB) -> None:
+    # Ties and NULLs in every sort column inv_browse offers
+    for i in range(37):
+        add_part(
+            db,
+            f"{['mcmaster', 'digikey', 'arduino'][i % 3]}:P{i:03d}",
+            units_received=None if i % 11 == 0 else i % 4,
+            avg_unit_cost=None if i % 5 == 0 else float(i % 3),
+            last_invoice=None if i % 4 == 0 else f"INV{i % 6}",
+            label_short=None if i % 7 == 0 else f"L{i % 2}",
+        )
+    for i in range(0, 37, 6):
+        remove(db, f"{['mcmaster', 'digikey', 'arduino'][i % 3]}:P{i:03d}", 1)
+
+
+@pytest.mark.parametrize("order_by", [
+    "vendor, sku",
+    "on_hand DESC, vendor, sku",
+    "avg_unit_cost DESC, vendor, sku",
+    "last_invoice DESC",
+    "last_invoice, label_short DESC",
+])
+def test_keyset_pages_match_offset_pages(db, order_by):
+    add_paging_parts(db)
+    keys = cli.parse_sort_keys(order_by)
+    order = cli.sort_keys_sql(keys)
+    cols = [col for col, _ in keys]
+    select = f"SELECT {', '.join(cols)} FROM inventory_view {{where}} ORDER BY {order} LIMIT ? {{offset}}"
+    total = db.scalar("SELECT COUNT(*) FROM inventory_view")
+
+    for page_size in (1, 4, 10):
+        by_offset = [
+            tuple(r)
+            for start in range(0, total, page_size)
+            for r in db.rows(select.format(where="", offset="OFFSET ?"), [page_size, start])
+        ]
+
+        by_seek = []
+        rows = db.rows(select.format(where="", offset=""), [page_size])
+        while rows:
+            by_seek.extend(tuple(r) for r in rows)
+            seek, seek_params = cli.seek_after_sql(keys, tuple(rows[-1]))
+            rows = db.rows(select.format(where=f"WHERE {seek}", offset=""), seek_params + [page_size])
+
+        assert len(by_offset) == total
+        assert by_seek == by_offset, page_size
+
+
+def test_parse_sort_keys_rejects_free_form_order():
+    assert cli.parse_sort_keys("vendor, sku") == [("vendor", False), ("sku", False), ("part_key", False)]
+    assert cli.parse_sort_keys("lower(vendor)") is None
+    assert cli.parse_sort_keys("vendor sideways") is None
+
+
+# ----------------------------
+# Search: FTS vs LIKE
+# ----------------------------
+# inv_search's LIKE query (short terms, or no FTS5)
+LIKE_WHERE = " OR ".join(f"{c} LIKE ? COLLATE NOCASE" for c in cli.INVENTORY_SEARCH_COLS)
+
+
+def search(db: DB, term: str, use_fts: bool) -> list[str]:
+    if use_fts:
+        where, params = cli.fts_part_keys_sql(), [cli.fts_phrase(term, cli.INVENTORY_SEARCH_COLS)]
+    else:
+        where, params = LIKE_WHERE, [f"%{term}%"] * len(cli.INVENTORY_SEARCH_COLS)
+    return [r[0] for r in db.rows(f"SELECT part_key FROM inventory_view WHERE {where} ORDER BY part_key", params)]
+
+
+def test_fts_search_matches_like_search(db):
+    add_part(db, "mcmaster:91290A115", description="Socket Head Screw M3 x 8", label_short="SHCS M3x8")
+    add_part(db, "mcmaster:94180A331", description="Heat-set insert for plastic", label_short="Insert M3")
+    add_part(db, "digikey:RES-10K", description='Resistor 10k 1/4W "axial"', label_short=None)
+    add_part(db, "arduino:ABX00087", description=None, label_short="UNO R4 WiFi",
+             label_line1="screw terminals")  # indexed, but not an inv_search column
+    assert cli.ensure_inventory_fts(db)
+
+    terms = ["screw", "SCREW", "m3", "M3x", "91290", "mcm", "key", "insert", '"axial"', "1/4W",
+             "uno r4", "terminals", "nothing here"]
+    for term in terms:
+        if len(term) < 3:
+            continue  # inv_search uses LIKE for these
+        assert search(db, term, use_fts=True) == search(db, term, use_fts=False), term
+
+    # The triggers keep the index in step with later writes
+    db.execute("UPDATE parts_received SET description = 'Hex nut' WHERE part_key = 'mcmaster:91290A115'")
+    add_part(db, "digikey:NUT-1", description="Nylon screw")
+    db.execute("DELETE FROM parts_received WHERE part_key = 'mcmaster:94180A331'")
+    for term in ["screw", "hex nut", "insert", "nylon"]:
+        assert search(db, term, use_fts=True) == search(db, term, use_fts=False), term
+
+
+# ----------------------------
+# CSV export
+# ----------------------------
+def read_csv(path, compressed=False):
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_csv_export_round_trips(db, tmp_path, compress):
+    costs = [6.224025481111165, 0.1 + 0.2, 1e-7, 123456789.12345678, None]
+    for i, cost in enumerate(costs):
+        add_part(db, f"mcmaster:P{i}", avg_unit_cost=cost,
+                 description=['comma, inside', 'quote " inside', "line\nbreak", "ünïcode", ""][i])
+
+    out = tmp_path / "exports" / "parts_received.csv"
+    cli.export_sqlite_object_to_csv(db, "parts_received", out, order_by="part_key", compress=compress)
+    if compress:
+        out = out.with_name(out.name + ".gz")
+
+    header, *rows = read_csv(out, compressed=compress)
+    assert header == cli.object_columns(db, "parts_received")
+    expected = db.rows("SELECT * FROM parts_received ORDER BY part_key")
+    assert len(rows) == len(expected)
+    for got, want in zip(rows, expected):
+        for cell, value in zip(got, want):
+            if value is None:
+                assert cell == ""
+            elif isinstance(value, float):
+                assert float(cell) == value  # every digit of the REAL survives
+            else:
+                assert cell == str(value)
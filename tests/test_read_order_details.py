@@ -0,0 +1,228 @@
+import random
+import re
+from datetime import datetime
+
+from studio_inventory import Read_Order_Details as rod
+
+
+# ----------------------------
+# Reference: the original (pre-optimization) implementations
+# ----------------------------
+def ref_normalize_text(txt: str) -> str:
+    txt = (txt or "").replace("\r", "\n")
+    txt = re.sub(r"[ \t]+", " ", txt)
+    txt = re.sub(r"\n{3,}", "\n\n", txt)
+    return txt.strip()
+
+
+_REF_MONEY = re.compile(r"\$?\s*([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)")
+
+
+def ref_money_to_float(s: str):
+    if not s:
+        return None
+    m = _REF_MONEY.search(s)
+    if not m:
+        return None
+    return float(m.group(1).replace(",", ""))
+
+
+def ref_extract_totals(text: str):
+    merch = ship = tax = total = None
+    for line in text.splitlines():
+        low = line.strip().lower()
+
+        if merch is None and low.startswith("merchandise"):
+            merch = ref_money_to_float(line)
+
+        elif ship is None and (low.startswith("shipping") or low.startswith("freight")):
+            ship = ref_money_to_float(line)
+
+        elif tax is None and ("sales tax" in low):
+            val = ref_money_to_float(line)
+            if val is not None:
+                tax = val
+
+        elif total is None and low.startswith("total"):
+            total = ref_money_to_float(line)
+
+    return merch, ship, tax, total
+
+
+def ref_parse_mmddyy(s: str):
+    if not s:
+        return None
+    s = s.strip()
+    for fmt in ("%m/%d/%y", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(s, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def ref_extract_first(pattern: str, text: str, flags=re.I):
+    m = re.search(pattern, text, flags)
+    return m.group(1).strip() if m else None
+
+
+def ref_extract_fields(text: str) -> dict:
+    """The original per-field extractors, as one dict (same keys as extract_fields)."""
+    inv = ref_extract_first(r"\bInvoice\b\s*([A-Z0-9\-]+)\b", text)
+    if inv is not None and inv.isdigit():
+        inv = int(inv)
+    inv_date = ref_extract_first(r"\bInvoice\s+Date\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", text)
+
+    cc = None
+    m = re.search(r"\bCredit\s+Card\s+([A-Za-z]+)\s+Ending-\s*([0-9]{4})\b", text, re.I)
+    if m:
+        cc = f"{m.group(1).strip().title()} ****{m.group(2)}"
+
+    pay_date = None
+    m = re.search(r"\bPayment\s+Received\b\s+([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", text, re.I)
+    if m:
+        pay_date = ref_parse_mmddyy(m.group(1))
+    else:
+        block_idx = text.lower().find("information about your payment")
+        if block_idx != -1:
+            window = text[block_idx:block_idx + 500]
+            m2 = re.search(r"\bDate\b\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{2,4})\b", window, re.I)
+            if m2:
+                pay_date = ref_parse_mmddyy(m2.group(1))
+
+    merch, ship, tax, total = ref_extract_totals(text)
+    return {
+        "purchase_order": ref_extract_first(r"\bPurchase\s+Order\b\s*([A-Z0-9\-]+)\b", text),
+        "invoice": inv,
+        "invoice_date": ref_parse_mmddyy(inv_date) if inv_date else None,
+        "account_number": ref_extract_first(r"\bYour\s+Account\b\s*([A-Z0-9\-]+)\b", text),
+        "credit_card": cc,
+        "payment_date": pay_date,
+        "merchandise": merch,
+        "shipping": ship,
+        "sales_tax": tax,
+        "total": total,
+    }
+
+
+# ----------------------------
+# Sample page text
+# ----------------------------
+RECEIPT_CRLF = (
+    "McMaster-Carr Supply Company\r\n"
+    "Purchase Order  CH-4471\r\n"
+    "Invoice\t55152414\r\n"
+    "Invoice Date 11/10/25\r\n\r\n\r\n"
+    "Your Account 1234567\r\n"
+    "Merchandise   $128.90\r\n"
+    "Shipping 7.51\r"
+    "Total $146.41\r\n"
+)
+
+# Receipt pages as normalize_text leaves them
+PAGES = [
+    rod.normalize_text(RECEIPT_CRLF),
+    # every field, with other text around the values
+    "Purchase Order CH-4471 Ship To: Studio\n"
+    "Invoice 55152414 Page 1 of 2\n"
+    "Invoice Date 11/10/25 Terms: Credit Card\n"
+    "Your Account 1234567\n"
+    "Credit Card amex Ending- 2008\n"
+    "Payment Received 11/11/25 (146.41)\n"
+    "Merchandise (incl. sales tax) 128.90\n"
+    "Freight $7.51\n"
+    "Sales Tax 10.00\n"
+    "Total 146.41",
+    # "Invoice Date" before the invoice number: the first "Invoice" match wins, as it always has
+    "Invoice Date 11/10/2025\nInvoice 55152414\nTotal 5.00",
+    # payment date only in the payment-info block
+    "Information about your payment\nMethod Visa\nDate 11/12/25\nMerchandise 3.00",
+    # merchandise already found on an earlier line: this one gives the tax instead
+    "Merchandise 5.00\nMerchandise and sales tax 0.40\nTotal 5.40",
+    # pdfium text often ends a line with the label and puts the value on the next line
+    "Invoice\n55152414\nPurchase Order\nCH-4471\nYour Account\n1234567\n"
+    "Credit Card\nAmex Ending- 2008\nPayment Received\n11/11/25\nTotal $146.41",
+    # nothing to find
+    "Packing list\n91290A115 Socket head screw 10 $12.00",
+]
+
+# Lines the totals logic reacts to, including the awkward ones: a keyword line without an
+# amount, a merchandise line that also mentions sales tax, "Total" inside other words
+TOTALS_LINES = [
+    "Merchandise $1,128.90",
+    "Merchandise",
+    "Merchandise (incl. sales tax) 12.00",
+    " merchandise 3",
+    "Shipping 7.51",
+    "Freight $22.00",
+    "Shipping and handling",
+    "Sales Tax 9.13",
+    "Estimated sales tax",
+    "Order sales tax $4.20",
+    "Total $146.41",
+    "Totals",
+    "Subtotal 99.00",
+    "Total due",
+    "Invoice 55152414",
+    "91290A115 Socket head screw 10 $12.00",
+]
+
+
+def test_normalize_text_matches_reference_on_samples():
+    samples = [
+        "",
+        "   ",
+        RECEIPT_CRLF,
+        "a\r\nb",
+        "a\r\n\r\nb",
+        "a\n\n\n\nb",
+        "a \t \tb\t",
+        "a\r\rb\n\r",
+        " \n lead and trail \n ",
+    ]
+    for s in samples:
+        assert rod.normalize_text(s) == ref_normalize_text(s), repr(s)
+
+
+def test_normalize_text_crlf_is_a_blank_line():
+    # "\r" -> "\n" first, so one CRLF becomes two line breaks (kept from the original)
+    assert rod.normalize_text("a\r\nb") == "a\n\nb"
+    assert rod.normalize_text("a\r\n\r\nb") == "a\n\nb"
+
+
+def test_normalize_text_matches_reference_fuzz():
+    rng = random.Random(1234)
+    alphabet = [" ", "\t", "\r", "\n", "a", "B", "7"]
+    for _ in range(5000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        assert rod.normalize_text(s) == ref_normalize_text(s), repr(s)
+
+
+def test_extract_totals_matches_reference_on_samples():
+    samples = [
+        rod.normalize_text(RECEIPT_CRLF),
+        "Merchandise (incl. sales tax) 12.00\nMerchandise 5.00\nSales Tax 1.00\nTotal 6.00",
+        "Merchandise 5.00\nMerchandise and sales tax 2.00\nTotal 7.00",
+        "Merchandise\nMerchandise 5.00\nShipping\nFreight 1.00\nTotal\nTotal 6.00",
+        "Subtotal 4.00\nTotal due\nSales tax",
+    ]
+    for text in samples:
+        assert rod.extract_totals(text) == ref_extract_totals(text), text
+
+
+def test_extract_totals_matches_reference_fuzz():
+    rng = random.Random(42)
+    for _ in range(3000):
+        text = "\n".join(rng.choice(TOTALS_LINES) for _ in range(rng.randint(0, 10)))
+        assert rod.extract_totals(text) == ref_extract_totals(text), text
+
+
+def test_extract_fields_matches_reference_on_pages():
+    for text in PAGES:
+        assert rod.extract_fields(text) == ref_extract_fields(text), text
+
+
+def test_extract_fields_reads_values_on_the_next_line():
+    found = rod.extract_fields("Invoice\n12345\nCredit Card\nAmex Ending- 2008")
+    assert found["invoice"] == 12345
+    assert found["credit_card"] == "Amex ****2008"